@@ -1,10 +1,11 @@
 import pygame
 import torch
 import torch.nn as nn
-import random
 import math
 import os
 
+from src.rng import RNG
+
 class EnduranceEngine(nn.Module):
     def __init__(self):
         super().__init__()
@@ -71,8 +72,8 @@ class EsiEscapeGame:
         
         self.trees = []
         for _ in range(120):
-            tx = random.randint(150, self.world_width - 100)
-            ty = random.randint(50, self.world_height - 100)
+            tx = RNG.randint(150, self.world_width - 100)
+            ty = RNG.randint(50, self.world_height - 100)
             self.trees.append(pygame.Rect(
                 tx + self.tree_offset_x,
                 ty + self.tree_offset_y,
@@ -105,15 +106,15 @@ class EsiEscapeGame:
         self.screen.blit(scaled_bg, (0, 0))
 
     def spawn_raider(self):
-        edge = random.choice(['LEFT', 'TOP', 'BOTTOM', 'RIGHT'])
+        edge = RNG.choice(['LEFT', 'TOP', 'BOTTOM', 'RIGHT'])
         if edge == 'LEFT':
-            x, y = self.camera_x - 40, random.randint(0, self.world_height)
+            x, y = self.camera_x - 40, RNG.randint(0, self.world_height)
         elif edge == 'RIGHT':
-            x, y = self.camera_x + self.screen_w + 40, random.randint(0, self.world_height)
+            x, y = self.camera_x + self.screen_w + 40, RNG.randint(0, self.world_height)
         elif edge == 'TOP':
-            x, y = random.randint(self.camera_x, self.camera_x + self.screen_w), -40
+            x, y = RNG.randint(self.camera_x, self.camera_x + self.screen_w), -40
         else:
-            x, y = random.randint(self.camera_x, self.camera_x + self.screen_w), self.world_height + 40
+            x, y = RNG.randint(self.camera_x, self.camera_x + self.screen_w), self.world_height + 40
         
         if len(self.raiders) >= 30:
             self.raiders.pop(0)
@@ -125,7 +126,7 @@ class EsiEscapeGame:
         self.raiders.append({
             "rect": rect,
             "pos": pygame.Vector2(rect.centerx, rect.centery),
-            "speed": random.uniform(4.4, 5.5)
+            "speed": RNG.uniform(4.4, 5.5)
         })
 
     def move_with_collision(self, rect, dx, dy):
@@ -337,6 +338,7 @@ class EsiEscapeGame:
         pygame.time.delay(2000)
 
 if __name__ == "__main__":
+    RNG.seed()
     game = EsiEscapeGame()
     game.run()
     pygame.quit()
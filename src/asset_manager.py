@@ -1,19 +1,58 @@
+import io
 import json
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pygame
 
-from src.sprite import Sprite
+from src.atlas import manifest_path, source_stamp
+from src.config import Config
+from src.sprite import SpriteData
+
+AUDIO_ASSET = "audio"
+FONT_ASSET = "font"
+IMAGE_ASSET = "image"
+SPRITE_ASSET = "sprite"
+PAGE_ASSET = "page"
+DECODED_KINDS = (AUDIO_ASSET, IMAGE_ASSET, PAGE_ASSET)
+
+
+def _surface_size(surface: pygame.Surface) -> int:
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+def _fetch(kind: str, spec: tuple):
+    # runs on decoder threads: nothing here may touch the display or the mixer
+    with open(spec[0], "rb") as file:
+        if kind != AUDIO_ASSET:
+            return pygame.image.load(file, spec[0])
+        return file.read()
+
+
+def _sound_size(sound: pygame.mixer.Sound) -> int:
+    frequency, sample_format, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
 
 
 class AssetManager:
     NULL_IMAGE: pygame.Surface | None = None
 
-    AUDIO_ASSETS: dict[str, pygame.mixer.Sound] = {}
-    FONT_ASSETS: dict[str, pygame.font.Font] = {}
-    IMAGE_ASSETS: dict[str, pygame.Surface] = {}
-    SPRITES: dict[str, Sprite] = {}
+    # everything in the guide is only described up front, an asset is decoded the first time it is asked for
+    SPECS: dict[tuple[str, str], tuple] = {}
+    LOADED: OrderedDict[tuple[str, str], tuple[object, int]] = OrderedDict()
+    PINS: dict[tuple[str, str], int] = {}
+    # images packed by src.atlas are served as subsurfaces of a shared page
+    ATLAS: dict[str, tuple[str, pygame.Rect]] = {}
+    BUDGET: int = 256 * 1024 * 1024
+    SIZE: int = 0
+    DECODER: ThreadPoolExecutor | None = None
+    # caches built from assets register here so an evicted asset is not kept alive by what was derived from it
+    EVICTION_HOOKS: list = []
 
     def __init__(self, asset_guide: str):
+        AssetManager.BUDGET = Config.ASSET_BUDGET
+
         with open(asset_guide, "r") as file:
             obj = json.load(file)
 
@@ -47,42 +86,179 @@ class AssetManager:
                 num_frames=sprite.get("num_frames")
             )
 
+        self.load_atlas(manifest_path(asset_guide))
+
+    @classmethod
+    def load_atlas(cls, manifest: str) -> None:
+        if not os.path.exists(manifest):
+            return
+
+        with open(manifest, "r") as file:
+            obj = json.load(file)
+
+        for i, page_path in enumerate(obj.get("pages", [])):
+            cls.SPECS[(PAGE_ASSET, str(i))] = (page_path,)
+
+        for name, entry in obj.get("images", {}).items():
+            # an image edited or moved since the atlas was packed is loaded from its own file again
+            spec: tuple | None = cls.SPECS.get((IMAGE_ASSET, name), None)
+            if spec is None or spec[0] != entry.get("source") or not os.path.exists(spec[0]) or \
+                    source_stamp(spec[0]) != entry.get("stamp"):
+                continue
+            cls.ATLAS[name] = (str(entry.get("page")), pygame.Rect(entry.get("x"), entry.get("y"),
+                                                                   entry.get("w"), entry.get("h")))
+
     @classmethod
     def add_audio(cls, name: str, audio_path: str) -> None:
-        cls.AUDIO_ASSETS[name] = pygame.mixer.Sound(audio_path)
+        cls.SPECS[(AUDIO_ASSET, name)] = (audio_path,)
 
     @classmethod
     def add_font(cls, name: str, font_path: str, font_size: int) -> None:
-        cls.FONT_ASSETS[name + str(font_size)] = pygame.font.Font(font_path, font_size)
+        cls.SPECS[(FONT_ASSET, name + str(font_size))] = (font_path, font_size)
 
     @classmethod
     def add_image(cls, name: str, image_path: str) -> None:
-        cls.IMAGE_ASSETS[name] = pygame.image.load(image_path).convert_alpha()
+        cls.SPECS[(IMAGE_ASSET, name)] = (image_path,)
 
     @classmethod
     def add_sprite(cls, name: str, sprite_sheet: str, dimensions: pygame.Vector2,
                    animations: list[str], animation_layout: str,
                    num_frames: int) -> None:
-        cls.SPRITES[name] = Sprite(
-            spritesheet=AssetManager.get_image(sprite_sheet),
-            dimensions=dimensions,
-            animations=animations,
-            row_major=animation_layout == "rows",
-            num_frames=num_frames
-        )
+        cls.SPECS[(SPRITE_ASSET, name)] = (sprite_sheet, dimensions, animations, animation_layout, num_frames)
+
+    @classmethod
+    def _load(cls, key: tuple[str, str], spec: tuple) -> tuple[object, int]:
+        match key[0]:
+            case "image" if key[1] in cls.ATLAS:
+                page, rect = cls.ATLAS[key[1]]
+                return cls._get(PAGE_ASSET, page).subsurface(rect), 0
+            case "audio" | "image" | "page":
+                return cls._finish(key, _fetch(key[0], spec))
+            case "font":
+                return pygame.font.Font(spec[0], spec[1]), os.path.getsize(spec[0])
+            case "sprite":
+                # frames are subsurfaces of the sheet, so the sheet image carries the memory
+                sprite_sheet, dimensions, animations, animation_layout, num_frames = spec
+                return SpriteData(
+                    spritesheet=cls.get_image(sprite_sheet),
+                    dimensions=dimensions,
+                    animations=animations,
+                    row_major=animation_layout == "rows",
+                    num_frames=num_frames
+                ), 0
+
+    @classmethod
+    def _finish(cls, key: tuple[str, str], fetched) -> tuple[object, int]:
+        if key[0] != AUDIO_ASSET:
+            image: pygame.Surface = fetched.convert_alpha()
+            return image, _surface_size(image)
+        sound: pygame.mixer.Sound = pygame.mixer.Sound(file=io.BytesIO(fetched))
+        return sound, _sound_size(sound)
+
+    @classmethod
+    def _store(cls, key: tuple[str, str], asset, size: int) -> None:
+        cls.LOADED[key] = (asset, size)
+        cls.SIZE += size
+        cls._evict()
+
+    @classmethod
+    def preload(cls, keys) -> None:
+        wanted: set[tuple[str, str]] = set()
+        for key in keys:
+            wanted.update(cls._dependencies(key))
+
+        if cls.DECODER is None:
+            cls.DECODER = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="asset_decoder")
+
+        # files are read and decoded in parallel, but finished in guide order so earlier names are ready first
+        pending: list[tuple[tuple[str, str], Future]] = [
+            (key, cls.DECODER.submit(_fetch, key[0], spec)) for key, spec in cls.SPECS.items()
+            if key in wanted and key[0] in DECODED_KINDS and key not in cls.LOADED and
+            not (key[0] == IMAGE_ASSET and key[1] in cls.ATLAS)
+        ]
+        for key, future in pending:
+            cls._store(key, *cls._finish(key, future.result()))
+
+        for key in wanted:
+            cls._get(*key)
+
+    @classmethod
+    def _get(cls, kind: str, name: str):
+        key: tuple[str, str] = (kind, name)
+        if (entry := cls.LOADED.get(key, None)) is not None:
+            cls.LOADED.move_to_end(key)
+            return entry[0]
+
+        if (spec := cls.SPECS.get(key, None)) is None:
+            return None
+
+        asset, size = cls._load(key, spec)
+        cls._store(key, asset, size)
+        return asset
+
+    @classmethod
+    def _evict(cls) -> None:
+        if cls.SIZE <= cls.BUDGET:
+            return
+
+        # anything still referenced by a scene object stays alive there, eviction only drops the cached reference
+        for key in [key for key in cls.LOADED if cls.PINS.get(key, 0) == 0]:
+            if key not in cls.LOADED:
+                continue
+            cls._drop(key)
+            # sprites built on a sheet and images served from a page would keep it alive without counting it
+            for dependent in [dependent for dependent in cls.LOADED if key in cls._dependencies(dependent)]:
+                cls._drop(dependent)
+            if cls.SIZE <= cls.BUDGET:
+                return
+
+    @classmethod
+    def _drop(cls, key: tuple[str, str]) -> None:
+        asset, size = cls.LOADED.pop(key)
+        cls.SIZE -= size
+        for hook in cls.EVICTION_HOOKS:
+            hook(asset)
+
+    @classmethod
+    def on_evict(cls, hook) -> None:
+        cls.EVICTION_HOOKS.append(hook)
+
+    @classmethod
+    def _dependencies(cls, key: tuple[str, str]) -> list[tuple[str, str]]:
+        if key[0] == SPRITE_ASSET and (spec := cls.SPECS.get(key, None)) is not None:
+            return [key] + cls._dependencies((IMAGE_ASSET, spec[0]))
+        if key[0] == IMAGE_ASSET and key[1] in cls.ATLAS:
+            return [key, (PAGE_ASSET, cls.ATLAS[key[1]][0])]
+        return [key]
+
+    @classmethod
+    def pin(cls, keys) -> None:
+        for key in keys:
+            for dependency in cls._dependencies(key):
+                cls.PINS[dependency] = cls.PINS.get(dependency, 0) + 1
+
+    @classmethod
+    def unpin(cls, keys) -> None:
+        for key in keys:
+            for dependency in cls._dependencies(key):
+                if (pins := cls.PINS.get(dependency, 0)) <= 1:
+                    cls.PINS.pop(dependency, None)
+                else:
+                    cls.PINS[dependency] = pins - 1
+        cls._evict()
 
     @classmethod
     def get_audio(cls, name: str) -> pygame.mixer.Sound | None:
-        return cls.AUDIO_ASSETS.get(name, None)
+        return cls._get(AUDIO_ASSET, name)
 
     @classmethod
     def get_font(cls, name: str) -> pygame.font.Font | None:
-        return cls.FONT_ASSETS.get(name, None)
+        return cls._get(FONT_ASSET, name)
 
     @classmethod
     def get_image(cls, name: str) -> pygame.Surface | None:
-        return cls.IMAGE_ASSETS.get(name, None)
+        return cls._get(IMAGE_ASSET, name)
 
     @classmethod
-    def get_sprite(cls, name: str) -> Sprite | None:
-        return cls.SPRITES.get(name, None)
\ No newline at end of file
+    def get_sprite(cls, name: str) -> SpriteData | None:
+        return cls._get(SPRITE_ASSET, name)
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pygame
+
+ATLAS_DIRECTORY = "atlas"
+ATLAS_MANIFEST = "atlas.json"
+ATLAS_PAGE_SIZE = 2048
+ATLAS_PADDING = 1
+
+
+def manifest_path(asset_guide: str) -> str:
+    return os.path.join(os.path.dirname(asset_guide), ATLAS_DIRECTORY, ATLAS_MANIFEST)
+
+
+def source_stamp(path: str) -> list[int]:
+    stat: os.stat_result = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _shelf_pack(sizes: dict[str, tuple[int, int]], page_size: int) -> tuple[dict[str, tuple[int, int, int]], list[int]]:
+    placements: dict[str, tuple[int, int, int]] = {}
+    page_heights: list[int] = []
+
+    page: int = -1
+    x: int = page_size
+    shelf_top: int = 0
+    shelf_height: int = 0
+    # tallest first keeps shelves tight, sprite sheets go in whole so their frames stay contiguous
+    for name in sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0], key)):
+        width, height = sizes[name][0] + ATLAS_PADDING, sizes[name][1] + ATLAS_PADDING
+
+        if x + width > page_size:
+            shelf_top += shelf_height
+            shelf_height = height
+            x = 0
+        if page < 0 or shelf_top + height > page_size:
+            page += 1
+            page_heights.append(0)
+            shelf_top = 0
+            shelf_height = height
+            x = 0
+
+        placements[name] = (page, x, shelf_top)
+        page_heights[page] = max(page_heights[page], shelf_top + height)
+        x += width
+
+    return placements, page_heights
+
+
+def pack_atlas(asset_guide: str, page_size: int = ATLAS_PAGE_SIZE) -> int:
+    with open(asset_guide, "r") as file:
+        obj = json.load(file)
+
+    images: dict[str, pygame.Surface] = {}
+    paths: dict[str, str] = {}
+    for image in obj.get("images", []):
+        surface: pygame.Surface = pygame.image.load(image.get("path"))
+        # anything that would not fit on a page keeps being loaded on its own
+        if surface.get_width() + ATLAS_PADDING > page_size or surface.get_height() + ATLAS_PADDING > page_size:
+            continue
+        images[image.get("name")] = surface
+        paths[image.get("name")] = image.get("path")
+
+    placements, page_heights = _shelf_pack({name: image.get_size() for name, image in images.items()}, page_size)
+
+    directory: str = os.path.dirname(manifest_path(asset_guide))
+    os.makedirs(directory, exist_ok=True)
+
+    pages: list[pygame.Surface] = [pygame.Surface((page_size, height), pygame.SRCALPHA) for height in page_heights]
+    for name, (page, x, y) in placements.items():
+        # max against a cleared page copies pixels exactly instead of alpha blending them
+        pages[page].blit(images[name], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+    page_paths: list[str] = []
+    for i, page in enumerate(pages):
+        page_paths.append(os.path.join(directory, f"page_{i}.png"))
+        pygame.image.save(page, page_paths[-1])
+
+    manifest: dict = {
+        "pages": page_paths,
+        "images": {
+            name: {
+                "page": page, "x": x, "y": y, "w": images[name].get_width(), "h": images[name].get_height(),
+                "source": paths[name], "stamp": source_stamp(paths[name])
+            } for name, (page, x, y) in placements.items()
+        }
+    }
+    with open(manifest_path(asset_guide), "w") as file:
+        json.dump(manifest, file, indent=2)
+
+    return len(pages)
@@ -0,0 +1,43 @@
+import time
+
+import pygame
+
+from src.game_backends.backend import GameState
+from src.input_source import Input
+from src.map_element import TiledSurfaceCache
+from src.profiler import Profiler
+from src.timestep import Timestep
+
+
+def run_benchmark(game, scene: str, frames: int) -> None:
+    # without a scene the game starts where it normally would, which is what replays expect
+    if scene:
+        game.scene_manager.start_scene = scene
+        game.set_backend(GameState.PLAYING)
+
+    # the first frame initialises the backend and loads the scene, which is not what is being measured
+    steps: int | None = Input.steps()
+    game.frame(0, steps if steps is not None else 1)
+
+    Profiler.enable()
+    start: float = time.perf_counter()
+    completed: int = 0
+    simulated: int = 0
+    # a replay that ran out would only feed the game a synthetic quit, which is not a recorded frame
+    while game.running and completed < frames and not Input.finished():
+        # replays step exactly as recorded, otherwise one fixed step per frame as fast as possible
+        steps = Input.steps()
+        game.frame(0, steps if steps is not None else 1)
+        completed += 1
+        simulated += Timestep.STEPS
+    elapsed: float = time.perf_counter() - start
+    if completed > 0:
+        print(f"{scene or game.scene_manager.current_scene}: {completed} frames, {simulated} steps of "
+              f"{Timestep.STEP * 1000:.3f} ms in {elapsed:.3f} s, {elapsed * 1000 / completed:.3f} ms/frame")
+        print(Profiler.report(completed))
+        print(TiledSurfaceCache.report())
+    else:
+        print("The game stopped before any frame could be measured")
+
+    Input.save()
+    pygame.quit()
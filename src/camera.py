@@ -1,8 +1,8 @@
-import random
-
 import pygame
 
 from src.config import Config
+from src.rng import RNG
+from src.timestep import Timestep
 
 
 def grid_pos_to_view_pos(grid_pos: pygame.Vector2) -> pygame.Vector2:
@@ -11,6 +11,9 @@ def grid_pos_to_view_pos(grid_pos: pygame.Vector2) -> pygame.Vector2:
 
 class Camera:
     POS: pygame.Vector2 = pygame.Vector2(0, 0)
+    PREV_POS: pygame.Vector2 = pygame.Vector2(0, 0)
+    RENDER_POS: pygame.Vector2 = pygame.Vector2(0, 0)
+    SNAP: bool = True
     WINDOW_CENTER: int = 0
 
     SHAKE_OFFSET: pygame.Vector2 = pygame.Vector2(0, 0)
@@ -38,10 +41,24 @@ class Camera:
 
     @classmethod
     def update(cls, bounds: pygame.Vector2, dt: float) -> None:
+        cls.PREV_POS = cls.POS.copy()
         cls.SHAKE_OFFSET = cls._get_shake_offset(dt)
         if cls.TRACK is not None:
             cls.center_at(cls.TRACK.pos, bounds)
 
+        if cls.SNAP:
+            cls.PREV_POS = cls.POS.copy()
+            cls.SNAP = False
+
+    @classmethod
+    def snap(cls) -> None:
+        cls.SNAP = True
+
+    @classmethod
+    def interpolate(cls) -> None:
+        cls.RENDER_POS = pygame.Vector2(Timestep.lerp(cls.PREV_POS.x, cls.POS.x),
+                                        Timestep.lerp(cls.PREV_POS.y, cls.POS.y))
+
     @classmethod
     def world_pos_to_view_pos(cls, world_pos: pygame.Vector2) -> pygame.Vector2:
         return world_pos - cls.POS
@@ -55,8 +72,8 @@ class Camera:
     @classmethod
     def _get_shake_offset(cls, dt: float) -> pygame.Vector2:
         if cls.SHAKE_DURATION > 0:
-            offset_x = random.uniform(-cls.SHAKE_AMOUNT.x, cls.SHAKE_AMOUNT.x)
-            offset_y = random.uniform(-cls.SHAKE_AMOUNT.y, cls.SHAKE_AMOUNT.y)
+            offset_x = RNG.uniform(-cls.SHAKE_AMOUNT.x, cls.SHAKE_AMOUNT.x)
+            offset_y = RNG.uniform(-cls.SHAKE_AMOUNT.y, cls.SHAKE_AMOUNT.y)
             
             cls.SHAKE_DURATION -= dt
             return pygame.Vector2(offset_x, offset_y)
@@ -5,6 +5,11 @@ class Config:
     WINDOW_DIMS: pygame.Vector2 = pygame.Vector2(0, 0)
     WINDOW_FULLSCREEN: bool = False
     TILE_SIZE: int = 32
+    DIRTY_RECTS: bool = False
+    TEXT_CACHE_BUDGET: int = 16 * 1024 * 1024
+    ASSET_BUDGET: int = 256 * 1024 * 1024
+    SIMULATION_RATE: int = 120
+    MAX_SIMULATION_STEPS: int = 8
 
     DIALOGUE_BOX_DIMS_FRACTIONS: pygame.Vector2 = pygame.Vector2(0, 0)
     DIALOGUE_BOX_DIMS: pygame.Vector2 = pygame.Vector2(0, 0)
@@ -36,6 +41,21 @@ class Config:
             cls.DIALOGUE_BOX_POS = pygame.Vector2(round(dlg_box_pos[0] * cls.WINDOW_DIMS.x),
                                                   round(dlg_box_pos[1] * cls.WINDOW_DIMS.y))
 
+        if (dirty_rects := obj.get("dirty_rects", None)) is not None:
+            cls.DIRTY_RECTS = dirty_rects
+
+        if (text_cache_budget := obj.get("text_cache_budget", None)) is not None:
+            cls.TEXT_CACHE_BUDGET = text_cache_budget
+
+        if (asset_budget := obj.get("asset_budget", None)) is not None:
+            cls.ASSET_BUDGET = asset_budget
+
+        if (simulation_rate := obj.get("simulation_rate", None)) is not None:
+            cls.SIMULATION_RATE = simulation_rate
+
+        if (max_simulation_steps := obj.get("max_simulation_steps", None)) is not None:
+            cls.MAX_SIMULATION_STEPS = max_simulation_steps
+
         if (tile_size := obj.get("tile_size", None)) is not None:
             cls.TILE_SIZE = tile_size
 
@@ -1,12 +1,13 @@
 import pygame
 
-from src.config import Config
+from src.dialogue_box import SPEAKER_IMAGE_MARGIN_TOP
+from src.dirty_rects import DirtyRects
 from src.event import DispatchChain
 from src.route_tracker import Conditions, Flags
+from src.typewriter import Typewriter
 from src.ui_manager import UIManager, Text, Button
 
 SPEAKER_IMAGE_MARGIN_LEFT = 15
-SPEAKER_IMAGE_MARGIN_TOP = 15
 
 SPEAKER_TEXT_POS = pygame.Vector2(30, 15)
 SPOKEN_TEXT_POS = pygame.Vector2(60, 80)
@@ -14,9 +15,6 @@ OPTIONS_START_RIGHT_PROPORTION = 1 / 4
 OPTIONS_DISTANCE_BETWEEN = 15
 OPTIONS_INDICATOR_OFFSET_X = 40
 
-TRIANGLE_MARGIN_RIGHT = 80
-TRIANGLE_MARGIN_BOTTOM = 50
-
 FADE_SPEED = 1000
 
 class MonologueLine:
@@ -53,9 +51,6 @@ class Monologue:
 
         self.speaking_sfx: pygame.mixer.Sound | None = speaking_sfx
         self.speaker_image: pygame.Surface | None = speaker_image
-        if self.speaker_image is not None:
-            size: int = Config.DIALOGUE_BOX_DIMS.y - SPEAKER_IMAGE_MARGIN_TOP * 2
-            self.speaker_image = pygame.transform.scale(self.speaker_image, pygame.Vector2(size, size))
 
         self.awaiting_choice: bool = False
         self.has_options: bool = len(self.options) > 0
@@ -64,7 +59,12 @@ class Monologue:
         if not lines:
             raise ValueError("Monologue requires at least one line")
 
-        self.spoken: str = ""
+        self.spoken_text: str = "".join(line.text for line in self.lines)
+        self.line_offsets: list[int] = [0]
+        for line in self.lines:
+            self.line_offsets.append(self.line_offsets[-1] + len(line.text))
+        self.typewriter: Typewriter | None = None
+
         self.line_index: list[int] = [0, len(self.lines)] # [ current, final ]
         self.char_index: list[int] = [0, len(self.lines[0].text)] # [ current, final ]
         self.char_duration: float = 0
@@ -80,6 +80,9 @@ class Monologue:
                 return route
         return None
 
+    def spoken_length(self) -> int:
+        return self.line_offsets[self.line_index[0]] + self.char_index[0]
+
     def line_finished(self) -> bool:
         return self.char_index[0] == self.char_index[1]
 
@@ -106,10 +109,12 @@ class Monologue:
         if self.is_reset: return
 
         self.awaiting_choice = False
-        self.spoken = ""
         self.line_index[0] = 0
         self.char_index[0] = 0
         self.char_index[1] = len(self.lines[0].text)
+        self.char_duration = 0
+        if self.typewriter is not None:
+            self.typewriter.reset()
 
         self.choice_fade: int = 0
         self.choice_fading: int = 0
@@ -130,7 +135,6 @@ class Monologue:
 
             self.char_index[1] = len(self.lines[self.line_index[0]].text)
             return ""
-        self.spoken += self.lines[self.line_index[0]].text[self.char_index[0]:]
         self.char_index[0] = self.char_index[1]
         return ""
 
@@ -143,13 +147,19 @@ class Monologue:
 
         self.char_duration += dt
 
-        if self.char_duration >= self.lines[self.line_index[0]].speed and not self.line_finished():
-            self.char_duration = 0
-            self.spoken += self.lines[self.line_index[0]].text[self.char_index[0]]
+        # several characters can be revealed in one frame, so text speed does not depend on frame rate
+        line: MonologueLine = self.lines[self.line_index[0]]
+        spoke: bool = False
+        while not self.line_finished() and self.char_duration >= line.speed:
+            self.char_duration -= line.speed
+            spoke = spoke or line.text[self.char_index[0]].isalpha()
             self.char_index[0] += 1
-            if self.speaking_sfx is not None:
-                if self.speaking_sfx.get_num_channels() == 0 and self.spoken[-1].isalpha():
-                    self.speaking_sfx.play()
+
+        if self.line_finished():
+            self.char_duration = 0
+
+        if spoke and self.speaking_sfx is not None and self.speaking_sfx.get_num_channels() == 0:
+            self.speaking_sfx.play()
 
         self.awaiting_choice = len(self.options) > 0 and self.line_finished() and self.last_rendered_line()
 
@@ -163,12 +173,13 @@ class Monologue:
                                       dims.height - SPEAKER_TEXT_POS.y)
         ), surface)
 
-        ui_manager.draw_text(Text(
-            self.spoken, [255, 255, 255, 255],
-            start + SPOKEN_TEXT_POS, self.font,
-            dimensions=pygame.Vector2(options_start.x - (start.x + SPOKEN_TEXT_POS.x),
-                                      dims.height - SPOKEN_TEXT_POS.y)
-        ), surface)
+        width: int = int(options_start.x - (start.x + SPOKEN_TEXT_POS.x))
+        if self.typewriter is None or self.typewriter.width != width:
+            self.typewriter = Typewriter(self.spoken_text, self.font, width, [255, 255, 255, 255])
+
+        text_surface: pygame.Surface = ui_manager.dialogue_box.lend_text_surface(self.typewriter)
+        self.typewriter.reveal(self.spoken_length())
+        surface.blit(text_surface, start + SPOKEN_TEXT_POS, pygame.Rect((0, 0), self.typewriter.size()))
 
     def draw_options(self, surface: pygame.Surface, ui_manager: UIManager,
                      start: pygame.Vector2, dims: pygame.Rect) -> None:
@@ -196,9 +207,10 @@ class Monologue:
 
         start: pygame.Vector2 = pygame.Vector2(0, 0)
         if self.speaker_image is not None:
-            draw_surface.blit(self.speaker_image, pygame.Vector2(SPEAKER_IMAGE_MARGIN_LEFT, SPEAKER_IMAGE_MARGIN_TOP))
+            portrait: pygame.Surface = ui_manager.dialogue_box.portrait(self.speaker_image)
+            draw_surface.blit(portrait, pygame.Vector2(SPEAKER_IMAGE_MARGIN_LEFT, SPEAKER_IMAGE_MARGIN_TOP))
 
-            start.x += SPEAKER_IMAGE_MARGIN_LEFT + self.speaker_image.get_width()
+            start.x += SPEAKER_IMAGE_MARGIN_LEFT + portrait.get_width()
 
         self.draw_text(draw_surface, ui_manager, options_start, start, dims)
 
@@ -226,14 +238,6 @@ class Dialogue:
 
         self.advance_block: bool = True
 
-        self.draw_surface: pygame.Surface = pygame.Surface(Config.DIALOGUE_BOX_DIMS).convert()
-
-        self.tri_coords: list[pygame.Vector2] = [
-            pygame.Vector2(-1, -1),
-            pygame.Vector2(0, 1),
-            pygame.Vector2(1, -1)
-        ]
-
     def start(self, scene) -> bool:
         self.playing = True
         self.fading = FADE_SPEED
@@ -333,34 +337,17 @@ class Dialogue:
 
         self.choice_index = ui_manager.choice
 
-    def draw_triangle(self, surface: pygame.Surface, dims: pygame.Rect):
-        tri_pos = pygame.Vector2(dims.x, dims.y) + pygame.Vector2(dims.width - TRIANGLE_MARGIN_RIGHT,
-                                                                  dims.height - TRIANGLE_MARGIN_BOTTOM)
-
-        pygame.draw.polygon(surface, Config.DIALOGUE_TRIANGLE_COLOR, [c * 10 + tri_pos for c in self.tri_coords])
-
-    def draw_dialogue_box(self):
-        pygame.draw.rect(self.draw_surface, Config.DIALOGUE_BOX_OUTLINE_COLOR, (
-            0, 0, Config.DIALOGUE_BOX_DIMS.x, Config.DIALOGUE_BOX_DIMS.y
-        ), width=Config.DIALOGUE_BOX_OUTLINE_THICKNESS)
-
-        pygame.draw.rect(self.draw_surface, Config.DIALOGUE_BOX_BACKGROUND_COLOR, (
-            Config.DIALOGUE_BOX_OUTLINE_THICKNESS, Config.DIALOGUE_BOX_OUTLINE_THICKNESS,
-            Config.DIALOGUE_BOX_DIMS.x - Config.DIALOGUE_BOX_OUTLINE_THICKNESS * 2,
-            Config.DIALOGUE_BOX_DIMS.y - Config.DIALOGUE_BOX_OUTLINE_THICKNESS
-        ))
-
     def render(self, surface: pygame.Surface, dims: pygame.Rect, ui_manager: UIManager) -> None:
         if not self.playing and self.fade == 0: return
 
-        self.draw_dialogue_box()
-        self.monologues.get(self.current_monologue).render(self.draw_surface, dims, ui_manager)
+        draw_surface: pygame.Surface = ui_manager.dialogue_box.begin()
+        self.monologues.get(self.current_monologue).render(draw_surface, dims, ui_manager)
 
-        if self.fade < 255:
-            self.draw_surface.set_alpha(self.fade)
+        draw_surface.set_alpha(self.fade if self.fade < 255 else None)
 
-        surface.blit(self.draw_surface, dims)
+        surface.blit(draw_surface, dims)
+        DirtyRects.mark(dims)
 
         if self.playing and self.monologues.get(self.current_monologue).line_finished() and \
                 not self.monologues.get(self.current_monologue).awaiting_choice:
-            self.draw_triangle(surface, dims)
+            ui_manager.dialogue_box.draw_triangle(surface, dims)
@@ -0,0 +1,88 @@
+import pygame
+
+from src.config import Config
+
+SPEAKER_IMAGE_MARGIN_TOP = 15
+
+TRIANGLE_MARGIN_RIGHT = 80
+TRIANGLE_MARGIN_BOTTOM = 50
+TRIANGLE_SIZE = 10
+
+
+class DialogueBox:
+    def __init__(self):
+        self.dims: pygame.Vector2 = pygame.Vector2(0, 0)
+
+        self.surface: pygame.Surface | None = None
+        self.chrome: pygame.Surface | None = None
+        self.triangle: pygame.Surface | None = None
+        self.portraits: dict[int, tuple[pygame.Surface, pygame.Surface]] = {}
+
+        # one reveal surface is shared by every monologue, only the typewriter drawing right now owns it
+        self.text_surface: pygame.Surface | None = None
+        self.text_owner = None
+
+    def bake(self) -> None:
+        self.dims = Config.DIALOGUE_BOX_DIMS.copy()
+        self.surface = pygame.Surface(self.dims).convert()
+
+        self.chrome = pygame.Surface(self.dims).convert()
+        pygame.draw.rect(self.chrome, Config.DIALOGUE_BOX_OUTLINE_COLOR, (
+            0, 0, self.dims.x, self.dims.y
+        ), width=Config.DIALOGUE_BOX_OUTLINE_THICKNESS)
+
+        pygame.draw.rect(self.chrome, Config.DIALOGUE_BOX_BACKGROUND_COLOR, (
+            Config.DIALOGUE_BOX_OUTLINE_THICKNESS, Config.DIALOGUE_BOX_OUTLINE_THICKNESS,
+            self.dims.x - Config.DIALOGUE_BOX_OUTLINE_THICKNESS * 2,
+            self.dims.y - Config.DIALOGUE_BOX_OUTLINE_THICKNESS
+        ))
+
+        self.triangle = pygame.Surface((TRIANGLE_SIZE * 2 + 1, TRIANGLE_SIZE * 2 + 1), pygame.SRCALPHA).convert_alpha()
+        self.triangle.fill((0, 0, 0, 0))
+        pygame.draw.polygon(self.triangle, Config.DIALOGUE_TRIANGLE_COLOR, [
+            (0, 0), (TRIANGLE_SIZE, TRIANGLE_SIZE * 2), (TRIANGLE_SIZE * 2, 0)
+        ])
+
+        self.portraits.clear()
+
+    def begin(self) -> pygame.Surface:
+        if self.surface is None or self.dims != Config.DIALOGUE_BOX_DIMS:
+            self.bake()
+
+        self.surface.blit(self.chrome, (0, 0))
+        return self.surface
+
+    def portrait(self, image: pygame.Surface) -> pygame.Surface:
+        if (cached := self.portraits.get(id(image), None)) is not None:
+            return cached[1]
+
+        size: int = Config.DIALOGUE_BOX_DIMS.y - SPEAKER_IMAGE_MARGIN_TOP * 2
+        scaled: pygame.Surface = pygame.transform.scale(image, pygame.Vector2(size, size))
+        self.portraits[id(image)] = (image, scaled)
+        return scaled
+
+    def forget(self, image) -> None:
+        if (cached := self.portraits.get(id(image), None)) is not None and cached[0] is image:
+            del self.portraits[id(image)]
+
+    def lend_text_surface(self, typewriter) -> pygame.Surface:
+        if self.text_owner is typewriter and typewriter.surface is self.text_surface:
+            return self.text_surface
+
+        width, height = typewriter.size()
+        if self.text_surface is None or self.text_surface.get_width() < width or \
+                self.text_surface.get_height() < height:
+            current: tuple[int, int] = self.text_surface.get_size() if self.text_surface is not None else (0, 0)
+            self.text_surface = pygame.Surface((max(width, current[0]), max(height, current[1])),
+                                               pygame.SRCALPHA).convert_alpha()
+        self.text_surface.fill((0, 0, 0, 0))
+
+        if self.text_owner is not None:
+            self.text_owner.detach()
+        self.text_owner = typewriter
+        typewriter.attach(self.text_surface)
+        return self.text_surface
+
+    def draw_triangle(self, surface: pygame.Surface, dims: pygame.Rect) -> None:
+        surface.blit(self.triangle, (dims.x + dims.width - TRIANGLE_MARGIN_RIGHT - TRIANGLE_SIZE,
+                                     dims.y + dims.height - TRIANGLE_MARGIN_BOTTOM - TRIANGLE_SIZE))
@@ -0,0 +1,37 @@
+import pygame
+
+from src.config import Config
+
+
+class DirtyRects:
+    FULL: bool = True
+    REPAINT: bool = True
+    TAINTED: bool = False
+    RECTS: list[pygame.Rect] = []
+
+    @classmethod
+    def mark(cls, rect: pygame.Rect) -> None:
+        if not cls.FULL:
+            cls.RECTS.append(pygame.Rect(rect))
+
+    @classmethod
+    def mark_full(cls) -> None:
+        cls.FULL = True
+
+    @classmethod
+    def taint(cls) -> None:
+        cls.FULL = True
+        cls.TAINTED = True
+
+    @classmethod
+    def present(cls) -> None:
+        if not Config.DIRTY_RECTS or cls.FULL:
+            pygame.display.flip()
+        elif cls.RECTS:
+            pygame.display.update(cls.RECTS)
+
+        # overlays drawn over the scene leave the window surface unusable as a base for the next frame
+        cls.REPAINT = cls.TAINTED
+        cls.TAINTED = False
+        cls.FULL = False
+        cls.RECTS.clear()
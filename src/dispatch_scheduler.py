@@ -0,0 +1,72 @@
+import heapq
+from functools import partial
+
+from src.event import DispatchChain
+
+
+class DispatchScheduler:
+    def __init__(self):
+        self.tick: int = 0
+        self.runnable: list[DispatchChain] = []
+        self.added: list[DispatchChain] = []
+        # chains waiting out a timer sit here keyed by the tick they wake on, stale entries are skipped on pop
+        self.sleeping: list[tuple[int, int, DispatchChain]] = []
+        self.sequence: int = 0
+
+    def add(self, chain: DispatchChain) -> None:
+        self.added.append(chain)
+
+    def _enlist(self, chain: DispatchChain) -> None:
+        if not chain.listed:
+            chain.listed = True
+            self.runnable.append(chain)
+
+    def remove(self, chain: DispatchChain) -> None:
+        chain.scheduled = False
+        chain.wake = -1
+        chain.parked = False
+
+    def _unpark(self, chain: DispatchChain) -> None:
+        if chain.scheduled and chain.parked:
+            chain.parked = False
+            self._enlist(chain)
+
+    def update(self, scene, dt: float) -> None:
+        self.tick += 1
+
+        while self.sleeping and self.sleeping[0][0] <= self.tick:
+            wake, _, chain = heapq.heappop(self.sleeping)
+            if chain.scheduled and chain.wake == wake:
+                chain.wake = -1
+                chain.resume()
+                self._enlist(chain)
+
+        for chain in self.added:
+            # a chain with nothing it can dispatch removed itself while starting
+            if not chain.active:
+                continue
+            chain.scheduled = True
+            chain.wake = -1
+            chain.parked = False
+            self._enlist(chain)
+        self.added.clear()
+
+        kept: int = 0
+        for chain in self.runnable:
+            if chain.scheduled and chain.wake < 0:
+                ticks: int | None = chain.update(scene, dt)
+                if chain.scheduled and ticks is not None:
+                    chain.wake = self.tick + ticks
+                    heapq.heappush(self.sleeping, (chain.wake, self.sequence, chain))
+                    self.sequence += 1
+                elif chain.scheduled and chain.blocked_on is not None:
+                    # blocked on a dispatch that finishes on its own, so it is only touched again once that happens
+                    chain.parked = True
+                    chain.blocked_on.listen(partial(self._unpark, chain))
+
+            if chain.scheduled and chain.wake < 0 and not chain.parked:
+                self.runnable[kept] = chain
+                kept += 1
+            else:
+                chain.listed = False
+        del self.runnable[kept:]
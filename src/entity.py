@@ -4,10 +4,12 @@ from src.asset_manager import AssetManager
 from src.camera import Camera
 from src.config import Config
 from src.entity_route import EntityRoute
-from src.map_element import MapElement
+from src.occupancy_grid import OccupancyGrid
+from src.render_queue import RenderQueue
 from src.route_tracker import Conditions
 from src.sprite import Sprite
 from src.sprite import dir_to_str
+from src.timestep import Timestep
 from src.ui_manager import UIManager
 
 
@@ -25,6 +27,8 @@ class Entity:
         self.waypoint_wait_time: float = 0
 
         self.pos: pygame.Vector2 = spawn * Config.TILE_SIZE
+        self.prev_pos: pygame.Vector2 = self.pos.copy()
+        self.prev_tick: int = -1
         self.moving: bool = False
         self.move_time: float = 0
 
@@ -49,9 +53,6 @@ class Entity:
         self.route_waypoint = 0
         self.waypoint_wait_time = 0
 
-    def get_collision(self, rect: pygame.Rect) -> bool:
-        return self.collision and rect.colliderect(pygame.Rect(self.grid_pos, self.hit_box))
-
     def look_at(self, grid_pos: pygame.Vector2) -> None:
         diff: pygame.Vector2 = self.grid_pos - grid_pos
         if diff.x == 0 and diff.y == 0:
@@ -65,7 +66,20 @@ class Entity:
     def input(self, keys: pygame.key.ScancodeWrapper) -> None:
         pass
 
-    def update(self, entities: list, map_elements: list[MapElement], ui_manager: UIManager, dt: float) -> None:
+    def snapshot(self) -> None:
+        self.prev_pos.update(self.pos)
+        self.prev_tick = Timestep.TICK
+
+    def render_pos(self) -> tuple[float, float]:
+        # entities that were not stepped on the latest tick have not moved since, so there is nothing to blend
+        if self.prev_tick != Timestep.TICK:
+            return self.pos.x, self.pos.y
+        return Timestep.lerp(self.prev_pos.x, self.pos.x), Timestep.lerp(self.prev_pos.y, self.pos.y)
+
+    def occupancy_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.grid_pos, self.hit_box)
+
+    def update(self, occupancy: OccupancyGrid, ui_manager: UIManager, dt: float) -> None:
         if self.waypoint_wait_time != 0:
             self.waypoint_wait_time -= dt
             if self.waypoint_wait_time < 0:
@@ -97,26 +111,21 @@ class Entity:
 
             collision: bool = False
             rect: pygame.Rect = pygame.Rect(target_grid_pos, self.hit_box)
-            for entity in entities:
-                if entity.get_collision(rect):
-                    self.moving = False
-                    self.velocity = pygame.Vector2(0, 0)
-                    self.move_time = 0
-                    collision = True
-                    break
-
-            if not collision:
-                for map_element in map_elements:
-                    if map_element.get_collision(rect):
-                        if self.current_route is not None:
-                            self.grid_pos = \
-                                self.routes.get(self.current_route).waypoints[self.route_waypoint].pos.copy()
-                            self.pos = self.grid_pos * Config.TILE_SIZE
-                        self.moving = False
-                        self.velocity = pygame.Vector2(0, 0)
-                        self.move_time = 0
-                        collision = True
-                        break
+            if occupancy.entity_collision(rect):
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
+                collision = True
+
+            elif occupancy.static_collision(rect):
+                if self.current_route is not None:
+                    self.grid_pos = \
+                        self.routes.get(self.current_route).waypoints[self.route_waypoint].pos.copy()
+                    self.pos = self.grid_pos * Config.TILE_SIZE
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
+                collision = True
 
             if not collision:
                 self.move_time += dt
@@ -140,6 +149,12 @@ class Entity:
 
         self.sprite.update(dt)
 
-    def render(self, surface: pygame.Surface) -> None:
-        centered: pygame.Vector2 = self.pos - self.sprite.dimensions / 2
-        surface.blit(self.sprite.get() or AssetManager.NULL_IMAGE, Camera.world_pos_to_view_pos(centered))
\ No newline at end of file
+    def render_state(self) -> tuple[pygame.Surface, tuple[float, float]]:
+        dims: pygame.Vector2 = self.sprite.dimensions
+        x, y = self.render_pos()
+        return self.sprite.get() or AssetManager.NULL_IMAGE, (x - dims.x / 2 - Camera.RENDER_POS.x,
+                                                             y - dims.y / 2 - Camera.RENDER_POS.y)
+
+    def submit(self, queue: RenderQueue) -> None:
+        image, dest = self.render_state()
+        queue.submit(self, image, dest, self.pos.y)
\ No newline at end of file
@@ -30,6 +30,9 @@ class DispatchEvent:
         self.org_wait: float = 0
         self.wait: float = 0
         self.dispatched: bool = False
+        # dispatches stepped by their chain keep it polled, every other one wakes its waiting chains on finish
+        self.animated: bool = False
+        self.listeners: list = []
 
     def is_complete(self, scene) -> bool:
         pass
@@ -37,6 +40,14 @@ class DispatchEvent:
     def dispatch(self, scene) -> None:
         self.dispatched = True
 
+    def listen(self, listener) -> None:
+        self.listeners.append(listener)
+
+    def finish(self) -> None:
+        listeners, self.listeners = self.listeners, []
+        for listener in listeners:
+            listener()
+
     def update(self, scene, dt: float) -> None:
         pass
 
@@ -49,6 +60,14 @@ class DispatchChain:
         self.active: bool = False
         self.last_dispatch_index: int = 0
         self.dispatch_index: int = 0
+        # index of the dispatch whose wait ran out while the chain slept in the scheduler
+        self.elapsed_index: int = -1
+
+        self.scheduled: bool = False
+        self.listed: bool = False
+        self.wake: int = -1
+        self.parked: bool = False
+        self.blocked_on: DispatchEvent | None = None
 
     def start(self, scene):
         if len(self.dispatches) == 1:
@@ -56,6 +75,7 @@ class DispatchChain:
 
         self.last_dispatch_index = 0
         self.dispatch_index = 0
+        self.elapsed_index = -1
 
         self.active = True
         while self.dispatches[self.dispatch_index].conditions is not None and \
@@ -70,42 +90,57 @@ class DispatchChain:
         self.last_dispatch_index = self.dispatch_index
         self.dispatch_index += 1
 
-    def update(self, scene, dt: float):
+    def resume(self) -> None:
+        self.elapsed_index = self.dispatch_index
+
+    def _block(self, dispatch: DispatchEvent) -> None:
+        if dispatch.dispatched and not dispatch.animated:
+            self.blocked_on = dispatch
+
+    def update(self, scene, dt: float) -> int | None:
+        self.blocked_on = None
         if not self.active:
-            return
+            return None
 
         if self.dispatch_index < len(self.dispatches):
             while self.dispatches[self.dispatch_index].conditions is not None and \
                     not self.dispatches[self.dispatch_index].conditions.satisfied():
                 self.dispatch_index += 1
 
-        if self.dispatches[self.last_dispatch_index].is_complete(scene) and \
-                self.last_dispatch_index == len(self.dispatches) - 1:
+        previous_complete: bool = self.dispatches[self.last_dispatch_index].is_complete(scene)
+        if previous_complete and self.last_dispatch_index == len(self.dispatches) - 1:
             scene.remove_dispatch_chain(self)
-            return
+            return None
 
-        if not self.dispatches[self.last_dispatch_index].is_complete(scene):
+        if not previous_complete:
             self.dispatches[self.last_dispatch_index].update(scene, dt)
 
         if self.dispatch_index >= len(self.dispatches):
-            return
+            self._block(self.dispatches[self.last_dispatch_index])
+            return None
 
         if self.dispatches[self.dispatch_index].wait_for_previous:
             if not self.dispatches[self.dispatch_index - 1].is_complete(scene):
-                return
+                self._block(self.dispatches[self.dispatch_index - 1])
+                return None
 
         if self.dispatches[self.dispatch_index].org_wait > 0:
-            if self.dispatches[self.dispatch_index].wait <= 0:
+            if self.dispatches[self.dispatch_index].wait <= 0 or self.elapsed_index == self.dispatch_index:
                 self.dispatches[self.dispatch_index].wait = self.dispatches[self.dispatch_index].org_wait
                 self.dispatches[self.dispatch_index].dispatch(scene)
+                self.elapsed_index = -1
                 self.last_dispatch_index = self.dispatch_index
                 self.dispatch_index += 1
+            elif previous_complete or not self.dispatches[self.last_dispatch_index].animated:
+                # nothing in flight needs stepping, so the chain sleeps out the whole wait instead of counting it down
+                return math.ceil(round(self.dispatches[self.dispatch_index].wait / dt, 6))
             else:
                 self.dispatches[self.dispatch_index].wait -= dt
         else:
             self.dispatches[self.dispatch_index].dispatch(scene)
             self.last_dispatch_index = self.dispatch_index
             self.dispatch_index += 1
+        return None
 
 
 class OnPlayerEnter(CatchEvent):
@@ -155,7 +190,7 @@ class AddEntity(DispatchEvent):
     def dispatch(self, scene) -> None:
         for identifier in self.ids:
             if scene.entities_dict.get(identifier) is not None:
-                scene.entities.append(scene.entities_dict.get(identifier))
+                scene.add_entity(scene.entities_dict.get(identifier))
         self.dispatched = True
 
 class RemoveEntity(DispatchEvent):
@@ -168,7 +203,7 @@ class RemoveEntity(DispatchEvent):
 
     def dispatch(self, scene) -> None:
         for identifier in self.ids:
-            scene.entities.remove(scene.entities_dict.get(identifier))
+            scene.remove_entity(scene.entities_dict.get(identifier))
         self.dispatched = True
 
 class SetEntityRoute(DispatchEvent):
@@ -240,6 +275,7 @@ class EndDialogueAbruptly(DispatchEvent):
 class MoveCameraPosition(DispatchEvent):
     def __init__(self, pos: pygame.Vector2, duration: float):
         super().__init__()
+        self.animated = True
         self.pos: pygame.Vector2 = pos * Config.TILE_SIZE - Camera.WINDOW_CENTER
         self.duration: float = duration
 
@@ -268,6 +304,7 @@ class MoveCameraPosition(DispatchEvent):
 class MoveCameraEntity(DispatchEvent):
     def __init__(self, entity_id: str, duration: float):
         super().__init__()
+        self.animated = True
         self.entity_id: str = entity_id
         self.duration: float = duration
 
@@ -319,6 +356,7 @@ class MovePlayer(DispatchEvent):
         scene.player.controls_disabled = True
         scene.player.routes["ROUTE"] = self.route
         scene.player.set_route("ROUTE")
+        scene.player.route_listeners.append(self.finish)
         self.dispatched = True
 
 class ResetCamera(DispatchEvent):
@@ -384,7 +422,7 @@ class EnableTrigger(DispatchEvent):
         return self.dispatched
 
     def dispatch(self, scene) -> None:
-        scene.triggers.get(self.trigger_id).disabled = False
+        scene.trigger_index.enable(scene.triggers.get(self.trigger_id))
         self.dispatched = True
 
 class DisableTrigger(DispatchEvent):
@@ -2,7 +2,7 @@ import sys
 
 import pygame
 
-from src.asset_manager import AssetManager
+from src.asset_manager import AssetManager, IMAGE_ASSET
 from src.camera import Camera
 from src.config import Config
 from src.game_backends.backend import GameState, Backend
@@ -11,16 +11,28 @@ from src.game_backends.main_menu import MainMenuBackend
 from src.game_backends.paused import PausedBackend
 from src.game_backends.playing import PlayingBackend
 from src.game_backends.scene_builder import SceneBuilderBackend
+from src.input_source import Input
+from src.map_element import TiledSurfaceCache
+from src.profiler import Profiler
+from src.profiler_overlay import ProfilerOverlay
 from src.scene_manager import SceneManager
-from src.ui_manager import UIManager
+from src.timestep import Timestep
+from src.ui_manager import TextCache, UIManager
+
+HEADLESS_WINDOW_DIMS = (1920, 1080)
 
 
 class Game:
     def __init__(self, asset_guide: str, scene_guide: str, config_path: str,
-                 game_state: GameState = GameState.MAIN_MENU):
+                 game_state: GameState = GameState.MAIN_MENU, headless: bool = False):
         self.running: bool = True
         Config.load(config_path)
 
+        if headless:
+            if Config.WINDOW_DIMS.x == 0 or Config.WINDOW_DIMS.y == 0:
+                Config.WINDOW_DIMS = pygame.Vector2(HEADLESS_WINDOW_DIMS)
+            Config.WINDOW_FULLSCREEN = False
+
         self.window_surface: pygame.Surface = pygame.display.set_mode(
             Config.WINDOW_DIMS, pygame.FULLSCREEN if Config.WINDOW_FULLSCREEN else 0)
         pygame.display.set_caption("Homegoing")
@@ -29,11 +41,16 @@ class Game:
 
         self.asset_manager: AssetManager = AssetManager(asset_guide)
         AssetManager.NULL_IMAGE = AssetManager.get_image("null")
+        AssetManager.pin([(IMAGE_ASSET, "null")])
         self.scene_manager: SceneManager = SceneManager(scene_guide)
         self.ui_manager: UIManager = UIManager(self.window_surface)
+        AssetManager.on_evict(TiledSurfaceCache.forget)
+        AssetManager.on_evict(TextCache.forget)
+        AssetManager.on_evict(self.ui_manager.dialogue_box.forget)
         
         self.clock: pygame.time.Clock = pygame.time.Clock()
-        self.delta_time: float = 0
+        Timestep.set_rate(Config.SIMULATION_RATE, Config.MAX_SIMULATION_STEPS)
+        self.delta_time: float = Timestep.STEP
 
         self.state: GameState = game_state
         self.state_backends: dict = {
@@ -54,18 +71,42 @@ class Game:
         self.next_backend = self.state_backends[state]
         self.state = state
 
-    def run(self, FPS: int) -> None:
-        while self.running:
-            self.delta_time = self.clock.tick(FPS) / 1000.0
+    def step(self) -> None:
+        self.delta_time = Timestep.STEP
+        self.backend.update(self)
+
+    def frame(self, frame_time: float, steps: int | None = None) -> None:
+        Timestep.begin(frame_time, steps)
 
-            if self.backend != self.next_backend:
-                if self.backend: self.backend.unload(self)
-                self.backend = self.next_backend
-                self.backend.init(self)
+        if self.backend != self.next_backend:
+            if self.backend: self.backend.unload(self)
+            self.backend = self.next_backend
+            self.backend.init(self)
 
-            self.backend.input(self)
-            self.backend.update(self)
-            self.backend.render(self)
+        Profiler.start("input")
+        Input.poll()
+        ProfilerOverlay.input(Input.events())
+        self.backend.input(self)
+        Profiler.stop("input")
+
+        Profiler.start("update")
+        while Timestep.consume():
+            self.step()
+            if not self.running or self.backend != self.next_backend:
+                break
+        Timestep.end()
+        Input.end_frame(Timestep.STEPS)
+        Profiler.stop("update")
+
+        Profiler.start("render")
+        self.backend.render(self)
+        Profiler.stop("render")
+        Profiler.end_frame()
+
+    def run(self, FPS: int) -> None:
+        while self.running:
+            self.frame(self.clock.tick(FPS) / 1000.0, Input.steps())
 
+        Input.save()
         pygame.quit()
         sys.exit()
@@ -2,8 +2,11 @@ import pygame
 import enum
 
 from src.asset_manager import AssetManager
+from src.dirty_rects import DirtyRects
 from src.game_backends.backend import Backend, GameState
-from src.ui_manager import Text, Button
+from src.input_source import Input
+from src.profiler_overlay import ProfilerOverlay
+from src.ui_manager import Text, Button, TextWidget, ButtonWidget, WidgetTree
 
 class Menu(enum.Enum):
     MAIN = 0
@@ -20,6 +23,9 @@ class MainMenuBackend(Backend):
         self.bottom_pos: pygame.Vector2 = pygame.Vector2(0, 0)
         self.top_pos: pygame.Vector2 = pygame.Vector2(0, 0)
 
+        self.menus: dict[Menu, WidgetTree] = {}
+        self.redraw: bool = True
+
     def init(self, game) -> None:
         self.next_backend = None
         self.fade = 255
@@ -31,13 +37,21 @@ class MainMenuBackend(Backend):
         self.bottom_pos = game.window_surface.get_rect().midbottom
         self.top_pos = game.window_surface.get_rect().midtop
 
+        self.menus = {
+            Menu.MAIN: self.build_main_menu(game),
+            Menu.HOW_TO_PLAY: self.build_how_to_play(game),
+            Menu.CREDITS: self.build_credits(game)
+        }
+
         self.switch_menu(game, Menu.MAIN)
 
     def unload(self, game) -> None:
         game.ui_manager.set_num_buttons(0)
+        self.menus = {}
 
     def switch_menu(self, game, new_menu: Menu) -> None:
         self.state = new_menu
+        self.redraw = True
 
         match new_menu:
             case Menu.MAIN:
@@ -50,7 +64,7 @@ class MainMenuBackend(Backend):
                 game.ui_manager.set_num_buttons(1)
 
     def input(self, game) -> None:
-        for event in pygame.event.get():
+        for event in Input.events():
             if event.type == pygame.QUIT:
                 game.running = False
 
@@ -76,7 +90,7 @@ class MainMenuBackend(Backend):
                         case Menu.CREDITS:
                             self.switch_menu(game, Menu.MAIN)
 
-        keys: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+        keys: pygame.key.ScancodeWrapper = Input.keys()
         game.ui_manager.input(keys)
 
     def update(self, game) -> None:
@@ -88,114 +102,125 @@ class MainMenuBackend(Backend):
                 return
             game.set_backend(self.next_backend)
 
-    def render_main_menu(self, game) -> None:
-        game.ui_manager.draw_text(Text(
+    def build_main_menu(self, game) -> WidgetTree:
+        tree: WidgetTree = WidgetTree()
+
+        tree.add(TextWidget(Text(
             "Homegoing", [170, 20, 20, 255],
             self.center_pos + pygame.Vector2(0, -230), AssetManager.get_font("snake192"),
             align_center=True
-        ))
+        )))
 
         play_text: str = "Continue" if game.state_backends[GameState.PLAYING].is_setup else "Play"
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             play_text, [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -20), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0))
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "How to Play", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 60), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 1)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 1))
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Credits", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 140), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2))
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Exit", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 220), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 3)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 3))
 
-    def render_how_to_play(self, game) -> None:
-        game.ui_manager.draw_text(Text(
+        return tree
+
+    def build_how_to_play(self, game) -> WidgetTree:
+        tree: WidgetTree = WidgetTree()
+
+        tree.add(TextWidget(Text(
             "How to Play", [170, 20, 20, 255],
             self.center_pos + pygame.Vector2(0, -200), AssetManager.get_font("snake64"),
             align_center=True
-        ))
+        )))
 
-        game.ui_manager.draw_text(Text(
+        tree.add(TextWidget(Text(
             "Walk around and talk with WASD or the arrow keys", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -60), AssetManager.get_font("snake46"),
             align_center=True
-        ))
+        )))
 
-        game.ui_manager.draw_text(Text(
+        tree.add(TextWidget(Text(
             "Interact with the environment with ENTER or SPACE", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 0), AssetManager.get_font("snake46"),
             align_center=True
-        ))
+        )))
 
-        game.ui_manager.draw_text(Text(
+        tree.add(TextWidget(Text(
             "Talk to characters and complete objectives", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 60), AssetManager.get_font("snake46"),
             align_center=True
-        ))
+        )))
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Understood", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 180), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0))
+
+        return tree
 
-    def render_credit(self, game, name: str, role: str, y: int):
-        game.ui_manager.draw_text(Text(
+    def add_credit(self, tree: WidgetTree, name: str, role: str, y: int):
+        tree.add(TextWidget(Text(
             name, [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(-200, y), AssetManager.get_font("snake46"),
             align_left=True
-        ))
+        )))
 
-        game.ui_manager.draw_text(Text(
+        tree.add(TextWidget(Text(
             role, [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(200, y), AssetManager.get_font("snake46"),
             align_right=True
-        ))
+        )))
 
-    def render_credits(self, game) -> None:
-        game.ui_manager.draw_text(Text(
+    def build_credits(self, game) -> WidgetTree:
+        tree: WidgetTree = WidgetTree()
+
+        tree.add(TextWidget(Text(
             "Credits", [170, 20, 20, 255],
             self.center_pos + pygame.Vector2(0, -300), AssetManager.get_font("snake64"),
             align_center=True
-        ))
+        )))
 
-        self.render_credit(game, "Mihir", "Programmer", -160)
-        self.render_credit(game, "Theodor", "Programmer", -100)
-        self.render_credit(game, "Abdulrahman", "Artist", -40)
-        self.render_credit(game, "Yazan", "Artist", 20)
-        self.render_credit(game, "Jonas", "Writer", 80)
+        self.add_credit(tree, "Mihir", "Programmer", -160)
+        self.add_credit(tree, "Theodor", "Programmer", -100)
+        self.add_credit(tree, "Abdulrahman", "Artist", -40)
+        self.add_credit(tree, "Yazan", "Artist", 20)
+        self.add_credit(tree, "Jonas", "Writer", 80)
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Back", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 200), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0))
 
-    def render(self, game) -> None:
-        game.window_surface.fill((0, 0, 0))
+        return tree
 
-        match self.state:
-            case Menu.MAIN:
-                self.render_main_menu(game)
-            case Menu.HOW_TO_PLAY:
-                self.render_how_to_play(game)
-            case Menu.CREDITS:
-                self.render_credits(game)
+    def render(self, game) -> None:
+        # menus are retained, so a frame with no selection change and no fade has nothing to draw
+        if not game.ui_manager.draw_widgets(self.menus[self.state],
+                                            force=self.redraw or self.fade > 0 or ProfilerOverlay.needs_redraw()):
+            return
 
         if self.fade > 0:
             self.overlay.set_alpha(self.fade)
             game.window_surface.blit(self.overlay, (0, 0))
+        self.redraw = self.fade > 0
 
-        pygame.display.flip()
\ No newline at end of file
+        # a whole frame is always presented, so nothing the overlay marks is kept for a later one
+        DirtyRects.mark_full()
+        ProfilerOverlay.draw(game.window_surface)
+        DirtyRects.present()
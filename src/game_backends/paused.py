@@ -1,8 +1,11 @@
 import pygame
 
 from src.asset_manager import AssetManager
+from src.dirty_rects import DirtyRects
 from src.game_backends.backend import Backend, GameState
-from src.ui_manager import Text, Button
+from src.input_source import Input
+from src.profiler_overlay import ProfilerOverlay
+from src.ui_manager import Text, Button, ButtonWidget, WidgetTree
 
 class PausedBackend(Backend):
     def __init__(self):
@@ -12,6 +15,9 @@ class PausedBackend(Backend):
         self.bottom_pos: pygame.Vector2 = pygame.Vector2(0, 0)
         self.top_pos: pygame.Vector2 = pygame.Vector2(0, 0)
 
+        self.menu: WidgetTree | None = None
+        self.redraw: bool = True
+
     def init(self, game) -> None:
         self.next_backend = None
         self.fade = 255
@@ -21,15 +27,19 @@ class PausedBackend(Backend):
 
         self.center_pos = game.window_surface.get_rect().center
         self.bottom_pos = game.window_surface.get_rect().midbottom
-        self.top_pos = game.window_surface.get_rect().midtop 
+        self.top_pos = game.window_surface.get_rect().midtop
+
+        self.menu = self.build_menu(game)
+        self.redraw = True
 
         game.ui_manager.set_num_buttons(3)
 
     def unload(self, game) -> None:
         game.ui_manager.set_num_buttons(0)
+        self.menu = None
 
     def input(self, game) -> None:
-        for event in pygame.event.get():
+        for event in Input.events():
             if event.type == pygame.QUIT:
                 game.running = False
 
@@ -47,7 +57,7 @@ class PausedBackend(Backend):
                             self.next_backend = GameState.QUITTING
                             return
 
-        keys: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+        keys: pygame.key.ScancodeWrapper = Input.keys()
         game.ui_manager.input(keys)
 
     def update(self, game) -> None:
@@ -59,29 +69,39 @@ class PausedBackend(Backend):
                 return
             game.set_backend(self.next_backend)
 
-    def render(self, game) -> None:
-        game.window_surface.fill((0, 0, 0))
+    def build_menu(self, game) -> WidgetTree:
+        tree: WidgetTree = WidgetTree()
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Continue", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, -70), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 0))
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Exit to Main Menu", [255, 255, 255, 255],
             self.center_pos, AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 1)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 1))
 
-        game.ui_manager.draw_button(Button(Text(
+        tree.add(ButtonWidget(Button(Text(
             "Exit to Desktop", [255, 255, 255, 255],
             self.center_pos + pygame.Vector2(0, 70), AssetManager.get_font("snake64"),
             align_center=True
-        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2)
+        ), pygame.Vector2(-40, 0), AssetManager.get_font("snake40"), [150, 0, 150, 255]), 2))
+
+        return tree
+
+    def render(self, game) -> None:
+        if not game.ui_manager.draw_widgets(self.menu,
+                                            force=self.redraw or self.fade > 0 or ProfilerOverlay.needs_redraw()):
+            return
 
         if self.fade > 0:
             self.overlay.set_alpha(self.fade)
             game.window_surface.blit(self.overlay, (0, 0))
+        self.redraw = self.fade > 0
 
-        pygame.display.flip()
+        DirtyRects.mark_full()
+        ProfilerOverlay.draw(game.window_surface)
+        DirtyRects.present()
@@ -1,6 +1,9 @@
 import pygame
 
+from src.dirty_rects import DirtyRects
 from src.game_backends.backend import Backend, GameState
+from src.input_source import Input
+from src.profiler_overlay import ProfilerOverlay
 
 
 class PlayingBackend(Backend):
@@ -20,12 +23,13 @@ class PlayingBackend(Backend):
         self.fading = 500
 
         self.overlay.fill((0, 0, 0))
+        DirtyRects.taint()
 
     def unload(self, game) -> None:
         game.scene_manager.scenes[game.scene_manager.current_scene].unload()
 
     def input(self, game) -> None:
-        for event in pygame.event.get():
+        for event in Input.events():
             if event.type == pygame.QUIT:
                 game.running = False
                 return
@@ -41,7 +45,7 @@ class PlayingBackend(Backend):
 
         if self.fading != 0 and self.fade != 0 and self.fade != 255: return
 
-        keys: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+        keys: pygame.key.ScancodeWrapper = Input.keys()
         game.scene_manager.input(game.ui_manager, keys)
 
     def update(self, game) -> None:
@@ -59,5 +63,7 @@ class PlayingBackend(Backend):
         if self.fade > 0:
             self.overlay.set_alpha(self.fade)
             game.window_surface.blit(self.overlay, (0, 0))
+            DirtyRects.taint()
 
-        pygame.display.flip()
\ No newline at end of file
+        ProfilerOverlay.draw(game.window_surface)
+        DirtyRects.present()
\ No newline at end of file
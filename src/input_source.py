@@ -0,0 +1,129 @@
+import enum
+import gzip
+import json
+
+import pygame
+
+RECORDING_VERSION = 1
+RECORDED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
+
+class InputMode(enum.Enum):
+    LIVE = 0
+    RECORD = 1
+    REPLAY = 2
+
+
+class Input:
+    MODE: InputMode = InputMode.LIVE
+    PATH: str = ""
+    SEED: int | None = None
+
+    # each frame is [steps, pressed scancodes or None when unchanged, [[event type, key], ...]]
+    FRAMES: list[list] = []
+    FRAME: int = 0
+
+    EVENTS: list[pygame.event.Event] = []
+    KEYS: pygame.key.ScancodeWrapper | None = None
+    PRESSED: list[int] | None = None
+    NUM_KEYS: int = 0
+
+    @classmethod
+    def record(cls, path: str, seed: int) -> None:
+        cls.MODE = InputMode.RECORD
+        cls.PATH = path
+        cls.SEED = seed
+        cls.FRAMES = []
+
+    @classmethod
+    def replay(cls, path: str) -> int:
+        with gzip.open(path, "rt") as file:
+            obj = json.load(file)
+
+        if obj.get("version", None) != RECORDING_VERSION:
+            raise ValueError(f"Unsupported input recording version in {path}")
+
+        cls.MODE = InputMode.REPLAY
+        cls.PATH = path
+        cls.SEED = obj.get("seed")
+        cls.NUM_KEYS = obj.get("num_keys")
+        cls.FRAMES = obj.get("frames")
+        cls.FRAME = 0
+        return cls.SEED
+
+    @classmethod
+    def save(cls) -> None:
+        if cls.MODE != InputMode.RECORD: return
+
+        with gzip.open(cls.PATH, "wt") as file:
+            json.dump({
+                "version": RECORDING_VERSION,
+                "seed": cls.SEED,
+                "num_keys": cls.NUM_KEYS,
+                "frames": cls.FRAMES
+            }, file, separators=(",", ":"))
+
+    @classmethod
+    def poll(cls) -> None:
+        if cls.MODE == InputMode.REPLAY:
+            cls._poll_replay()
+            return
+
+        cls.EVENTS = pygame.event.get()
+        cls.KEYS = pygame.key.get_pressed()
+        if cls.MODE != InputMode.RECORD: return
+
+        cls.NUM_KEYS = len(cls.KEYS)
+        # iterating the wrapper yields raw scancode order, indexing it would translate keycodes
+        pressed: list[int] = [i for i, down in enumerate(cls.KEYS) if down]
+        cls.FRAMES.append([
+            0,
+            pressed if pressed != cls.PRESSED else None,
+            [[event.type, getattr(event, "key", 0)] for event in cls.EVENTS if event.type in RECORDED_EVENTS]
+        ])
+        cls.PRESSED = pressed
+
+    @classmethod
+    def _poll_replay(cls) -> None:
+        # the real queue still has to be drained to keep the window responsive
+        pygame.event.pump()
+        pygame.event.clear()
+
+        if cls.FRAME >= len(cls.FRAMES):
+            cls.EVENTS = [pygame.event.Event(pygame.QUIT)]
+            return
+
+        _, pressed, events = cls.FRAMES[cls.FRAME]
+        if pressed is not None or cls.KEYS is None:
+            state: list[bool] = [False] * cls.NUM_KEYS
+            for i in pressed or []:
+                state[i] = True
+            cls.KEYS = pygame.key.ScancodeWrapper(state)
+
+        cls.EVENTS = [pygame.event.Event(event_type, key=key) if event_type != pygame.QUIT else
+                      pygame.event.Event(event_type) for event_type, key in events]
+
+    @classmethod
+    def finished(cls) -> bool:
+        return cls.MODE == InputMode.REPLAY and cls.FRAME >= len(cls.FRAMES)
+
+    @classmethod
+    def steps(cls) -> int | None:
+        if cls.MODE != InputMode.REPLAY or cls.FRAME >= len(cls.FRAMES):
+            return None
+        return cls.FRAMES[cls.FRAME][0]
+
+    @classmethod
+    def end_frame(cls, steps: int) -> None:
+        if cls.MODE == InputMode.RECORD:
+            cls.FRAMES[-1][0] = steps
+        elif cls.MODE == InputMode.REPLAY:
+            cls.FRAME += 1
+
+    @classmethod
+    def events(cls) -> list[pygame.event.Event]:
+        return cls.EVENTS
+
+    @classmethod
+    def keys(cls) -> pygame.key.ScancodeWrapper:
+        return cls.KEYS
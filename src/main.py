@@ -1,30 +1,72 @@
+import os
+
 import pygame
 import argparse
 
 from src.game import Game
 from src.game_backends.backend import GameState
+from src.atlas import pack_atlas
+from src.benchmark import run_benchmark
+from src.input_source import Input
+from src.rng import RNG
 
 # from scalene import scalene_profiler
 
 def main():
-    pygame.init()
-
     parser: argparse.ArgumentParser = argparse.ArgumentParser()
     parser.add_argument("-sb", action="store_true", dest="scene_editor", default=False)
     parser.add_argument("-ec", action="store_true", dest="entity_configurer", default=False)
+    parser.add_argument("--headless", action="store_true", dest="headless", default=False)
+    parser.add_argument("--bench", nargs="?", const="", dest="bench", default=None)
+    parser.add_argument("--frames", type=int, dest="frames", default=600)
+    parser.add_argument("--record", dest="record", default=None)
+    parser.add_argument("--replay", dest="replay", default=None)
+    parser.add_argument("--seed", type=int, dest="seed", default=None)
+    parser.add_argument("--pack-atlas", action="store_true", dest="pack_atlas", default=False)
     res = parser.parse_args()
 
+    if res.frames < 1:
+        parser.error("--frames must be at least 1")
+
+    if res.pack_atlas:
+        print(f"Packed {pack_atlas('assets/asset_guide.json')} atlas pages")
+        return
+
     if res.scene_editor and res.entity_configurer:
         print("Can not start in both Scene Editor and Entity Configurer")
         exit(1)
 
+    if res.record is not None and res.replay is not None:
+        print("Can not record and replay at the same time")
+        exit(1)
+
+    if res.replay is not None:
+        RNG.seed(Input.replay(res.replay))
+    else:
+        seed: int = RNG.seed(res.seed)
+        if res.record is not None:
+            Input.record(res.record, seed)
+
+    if res.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    pygame.init()
+
     state: GameState = GameState.SCENE_BUILDER if res.scene_editor else \
                        GameState.ENTITY_CONFIGURER if res.entity_configurer else \
                        GameState.MAIN_MENU
 
     # scalene_profiler.start()
 
-    game: Game = Game("assets/asset_guide.json", "scenes/scene_guide.json", "config.json", game_state=state)
+    game: Game = Game("assets/asset_guide.json", "scenes/scene_guide.json", "config.json", game_state=state,
+                      headless=res.headless)
+    if res.bench is not None:
+        if res.bench and res.bench not in game.scene_manager.scene_paths:
+            parser.error(f"--bench: unknown scene '{res.bench}', "
+                         f"expected one of {', '.join(game.scene_manager.scene_paths)}")
+        run_benchmark(game, res.bench, res.frames)
+        return
     game.run(60)
 
     # scalene_profiler.stop()
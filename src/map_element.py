@@ -2,6 +2,50 @@ import pygame
 
 from src.camera import Camera
 from src.config import Config
+from src.render_queue import RenderQueue
+
+
+class TiledSurfaceCache:
+    SURFACES: dict[tuple[int, int, int, int], tuple[pygame.Surface, pygame.Surface]] = {}
+    HITS: int = 0
+    BYTES_SAVED: int = 0
+
+    @classmethod
+    def get(cls, image: pygame.Surface, rect: pygame.Rect) -> pygame.Surface:
+        # the image is kept alive alongside its tiled surface so its id can not be reused by another image
+        key: tuple[int, int, int, int] = (id(image), rect.w, rect.h, Config.TILE_SIZE)
+        if (cached := cls.SURFACES.get(key, None)) is not None:
+            surface: pygame.Surface = cached[1]
+            cls.HITS += 1
+            cls.BYTES_SAVED += surface.get_bytesize() * surface.get_width() * surface.get_height()
+            return surface
+
+        dims: pygame.Vector2 = pygame.Vector2(image.get_size()) / Config.TILE_SIZE
+        dims = pygame.Vector2(dims.x * rect.w, dims.y * rect.h)
+
+        surface: pygame.Surface = pygame.Surface((dims.x * Config.TILE_SIZE, dims.y * Config.TILE_SIZE)).convert()
+        for x_pos in range(int(dims.x)):
+            for y_pos in range(int(dims.y)):
+                surface.blit(image, (x_pos * Config.TILE_SIZE, y_pos * Config.TILE_SIZE))
+
+        cls.SURFACES[key] = (image, surface)
+        return surface
+
+    @classmethod
+    def release(cls, surfaces: list[pygame.Surface]) -> None:
+        released: set[int] = {id(surface) for surface in surfaces}
+        for key in [key for key, cached in cls.SURFACES.items() if id(cached[1]) in released]:
+            del cls.SURFACES[key]
+
+    @classmethod
+    def forget(cls, image) -> None:
+        for key in [key for key, cached in cls.SURFACES.items() if cached[0] is image]:
+            del cls.SURFACES[key]
+
+    @classmethod
+    def report(cls) -> str:
+        return f"{len(cls.SURFACES)} tiled surfaces shared by {len(cls.SURFACES) + cls.HITS} map elements, " \
+               f"{cls.BYTES_SAVED / 1024:.1f} KiB saved"
 
 
 class MapElement:
@@ -9,22 +53,22 @@ class MapElement:
         self.rect: pygame.Rect = rect
         self.collision: bool = collision
 
-        self.render_surface: pygame.Surface | None = None
         self.image_dims: pygame.Vector2 = pygame.Vector2(image.get_size())
+        self.upright: bool = self.image_dims.y > Config.TILE_SIZE
 
-        dims: pygame.Vector2 = pygame.Vector2(image.get_size()) / Config.TILE_SIZE
-        self._generate_render_surface(image, pygame.Vector2(dims.x * self.rect.w, dims.y * self.rect.h))
-
-    def get_collision(self, rect: pygame.Rect) -> bool:
-        return self.collision and rect.colliderect(self.rect)
+        # shared between every element with the same image and size, must never be drawn on
+        # flat elements let go of it once their scene's map layer has baked it into chunks
+        self.render_surface: pygame.Surface | None = TiledSurfaceCache.get(image, self.rect)
 
-    def render(self, surface: pygame.Surface) -> None:
+    def world_pos(self) -> pygame.Vector2:
         centered: pygame.Vector2 = pygame.Vector2(self.rect.topleft) * Config.TILE_SIZE - self.image_dims / 2
         centered.y -= self.image_dims.y - Config.TILE_SIZE
-        surface.blit(self.render_surface, Camera.world_pos_to_view_pos(centered))
+        return centered
 
-    def _generate_render_surface(self, image: pygame.Surface, dims: pygame.Vector2) -> None:
-        self.render_surface = pygame.Surface((dims.x * Config.TILE_SIZE, dims.y * Config.TILE_SIZE)).convert()
-        for x_pos in range(int(dims.x)):
-            for y_pos in range(int(dims.y)):
-                self.render_surface.blit(image, (x_pos * Config.TILE_SIZE, y_pos * Config.TILE_SIZE))
+    def world_rect(self) -> pygame.Rect:
+        return self.render_surface.get_rect(topleft=self.world_pos())
+
+    def submit(self, queue: RenderQueue) -> None:
+        centered: pygame.Vector2 = self.world_pos()
+        queue.submit(self, self.render_surface, (centered.x - Camera.RENDER_POS.x, centered.y - Camera.RENDER_POS.y),
+                     (self.rect.bottom - 1) * Config.TILE_SIZE)
@@ -0,0 +1,67 @@
+import pygame
+
+from src.camera import Camera
+from src.config import Config
+from src.map_element import MapElement, TiledSurfaceCache
+
+CHUNK_SIZE: int = 512
+
+
+class MapLayer:
+    def __init__(self, map_elements: list[MapElement]):
+        self.map_elements: list[MapElement] = map_elements
+        self.chunks: dict[tuple[int, int], pygame.Surface] = {}
+        self.baked: bool = False
+
+    def bake(self) -> None:
+        self.chunks.clear()
+
+        baked: list[MapElement] = []
+        for map_element in self.map_elements:
+            if map_element.upright:
+                continue
+            baked.append(map_element)
+
+            origin: pygame.Vector2 = map_element.world_pos()
+            width, height = map_element.render_surface.get_size()
+
+            for chunk_x in range(int(origin.x // CHUNK_SIZE), int((origin.x + width - 1) // CHUNK_SIZE) + 1):
+                for chunk_y in range(int(origin.y // CHUNK_SIZE), int((origin.y + height - 1) // CHUNK_SIZE) + 1):
+                    chunk: pygame.Surface | None = self.chunks.get((chunk_x, chunk_y), None)
+                    if chunk is None:
+                        chunk = pygame.Surface((CHUNK_SIZE, CHUNK_SIZE), pygame.SRCALPHA).convert_alpha()
+                        chunk.fill((0, 0, 0, 0))
+                        self.chunks[(chunk_x, chunk_y)] = chunk
+                    chunk.blit(map_element.render_surface,
+                               (origin.x - chunk_x * CHUNK_SIZE, origin.y - chunk_y * CHUNK_SIZE))
+
+        # fully covered chunks do not need per-pixel alpha, which makes them much cheaper to blit
+        for key, chunk in self.chunks.items():
+            if pygame.mask.from_surface(chunk).count() == CHUNK_SIZE * CHUNK_SIZE:
+                self.chunks[key] = chunk.convert()
+
+        # the chunks replace the flat elements' tiled surfaces instead of keeping a second copy of the map
+        TiledSurfaceCache.release([map_element.render_surface for map_element in baked])
+        for map_element in baked:
+            map_element.render_surface = None
+
+        self.baked = True
+
+    def render(self, surface: pygame.Surface) -> None:
+        if not self.chunks:
+            return
+
+        first_x: int = int(Camera.RENDER_POS.x // CHUNK_SIZE)
+        last_x: int = int((Camera.RENDER_POS.x + Config.WINDOW_DIMS.x - 1) // CHUNK_SIZE)
+        first_y: int = int(Camera.RENDER_POS.y // CHUNK_SIZE)
+        last_y: int = int((Camera.RENDER_POS.y + Config.WINDOW_DIMS.y - 1) // CHUNK_SIZE)
+
+        blits: list = []
+        for chunk_x in range(first_x, last_x + 1):
+            for chunk_y in range(first_y, last_y + 1):
+                chunk: pygame.Surface | None = self.chunks.get((chunk_x, chunk_y), None)
+                if chunk is not None:
+                    blits.append((chunk, (chunk_x * CHUNK_SIZE - Camera.RENDER_POS.x,
+                                          chunk_y * CHUNK_SIZE - Camera.RENDER_POS.y)))
+
+        surface.blits(blits, doreturn=False)
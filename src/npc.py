@@ -5,7 +5,7 @@ from src.dialogue import Dialogue
 from src.entity import Entity
 from src.entity_route import EntityRoute
 from src.interactable import Interactable
-from src.map_element import MapElement
+from src.occupancy_grid import OccupancyGrid
 from src.player import Player
 from src.route_tracker import Conditions
 from src.sprite import Sprite, dir_to_str
@@ -47,8 +47,7 @@ class NPC(Entity, Interactable):
     def input(self, keys: pygame.key.ScancodeWrapper) -> None:
         pass
 
-    def update(self, entities: list[Entity], map_elements: list[MapElement], ui_manager: UIManager, dt: float)\
-            -> None:
+    def update(self, occupancy: OccupancyGrid, ui_manager: UIManager, dt: float) -> None:
         if self.waypoint_wait_time != 0:
             self.waypoint_wait_time -= dt
             if self.waypoint_wait_time < 0:
@@ -80,25 +79,20 @@ class NPC(Entity, Interactable):
 
             collision: bool = False
             rect: pygame.Rect = pygame.Rect(target_grid_pos, self.hit_box)
-            for entity in entities:
-                if entity.get_collision(rect):
-                    self.moving = False
-                    self.velocity = pygame.Vector2(0, 0)
-                    self.move_time = 0
-                    collision = True
-                    break
-
-            if not collision:
-                for map_element in map_elements:
-                    if map_element.get_collision(rect):
-                        if self.current_route is not None:
-                            self.grid_pos = self.routes.get(self.current_route).waypoints[self.route_waypoint].pos
-                            self.pos = self.grid_pos * Config.TILE_SIZE
-                        self.moving = False
-                        self.velocity = pygame.Vector2(0, 0)
-                        self.move_time = 0
-                        collision = True
-                        break
+            if occupancy.entity_collision(rect):
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
+                collision = True
+
+            elif occupancy.static_collision(rect):
+                if self.current_route is not None:
+                    self.grid_pos = self.routes.get(self.current_route).waypoints[self.route_waypoint].pos
+                    self.pos = self.grid_pos * Config.TILE_SIZE
+                self.moving = False
+                self.velocity = pygame.Vector2(0, 0)
+                self.move_time = 0
+                collision = True
 
             if not collision:
                 self.move_time += dt
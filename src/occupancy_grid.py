@@ -0,0 +1,72 @@
+from array import array
+
+import pygame
+
+
+class OccupancyGrid:
+    def __init__(self, bounds: pygame.Vector2, static_rects: list[pygame.Rect]):
+        # the grid covers the scene bounds plus every static collider, so static lookups never miss
+        extent: pygame.Rect = pygame.Rect(0, 0, int(bounds.x) + 1, int(bounds.y) + 1).unionall(static_rects) \
+            if static_rects else pygame.Rect(0, 0, int(bounds.x) + 1, int(bounds.y) + 1)
+        self.origin_x: int = extent.x
+        self.origin_y: int = extent.y
+        self.width: int = extent.width
+        self.height: int = extent.height
+        self.extent: pygame.Rect = extent
+
+        self.static: array = array("H", bytes(2 * self.width * self.height))
+        self.dynamic: array = array("H", bytes(2 * self.width * self.height))
+
+        self.placements: dict[object, pygame.Rect] = {}
+        # colliders reaching past the grid are rare, so they are simply tested one by one
+        self.outside: set = set()
+
+        for rect in static_rects:
+            self._add(self.static, rect, 1)
+
+    def _add(self, cells: array, rect: pygame.Rect, amount: int) -> None:
+        for y in range(rect.top - self.origin_y, rect.bottom - self.origin_y):
+            row: int = y * self.width
+            for x in range(rect.left - self.origin_x, rect.right - self.origin_x):
+                cells[row + x] += amount
+
+    def _any(self, cells: array, rect: pygame.Rect) -> bool:
+        clipped: pygame.Rect = rect.clip(self.extent)
+        for y in range(clipped.top - self.origin_y, clipped.bottom - self.origin_y):
+            row: int = y * self.width
+            for x in range(clipped.left - self.origin_x, clipped.right - self.origin_x):
+                if cells[row + x]:
+                    return True
+        return False
+
+    def place(self, obj, rect: pygame.Rect) -> None:
+        if self.extent.contains(rect):
+            self._add(self.dynamic, rect, 1)
+        else:
+            self.outside.add(obj)
+        self.placements[obj] = rect
+
+    def move(self, obj, rect: pygame.Rect) -> bool:
+        if self.placements.get(obj, None) == rect:
+            return False
+
+        self.remove(obj)
+        self.place(obj, rect)
+        return True
+
+    def remove(self, obj) -> None:
+        if (rect := self.placements.pop(obj, None)) is None:
+            return
+
+        if obj in self.outside:
+            self.outside.discard(obj)
+        else:
+            self._add(self.dynamic, rect, -1)
+
+    def static_collision(self, rect: pygame.Rect) -> bool:
+        return self._any(self.static, rect)
+
+    def entity_collision(self, rect: pygame.Rect) -> bool:
+        if self._any(self.dynamic, rect):
+            return True
+        return any(rect.colliderect(self.placements[obj]) for obj in self.outside)
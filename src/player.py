@@ -1,11 +1,9 @@
 import pygame
 
-from src.asset_manager import AssetManager
-from src.camera import Camera
 from src.config import Config
 from src.entity import Entity
-from src.map_element import MapElement
-from src.route_tracker import Conditions
+from src.occupancy_grid import OccupancyGrid
+from src.route_tracker import ALWAYS
 from src.sprite import Sprite
 from src.sprite import dir_to_str
 from src.ui_manager import UIManager
@@ -13,10 +11,12 @@ from src.ui_manager import UIManager
 
 class Player(Entity):
     def __init__(self, spawn: pygame.Vector2, sprite: Sprite, move_duration: float):
-        super().__init__(sprite, True, spawn, Conditions([], [], []), {})
+        super().__init__(sprite, True, spawn, ALWAYS, {})
 
         self.move_duration: float = move_duration
         self.controls_disabled: bool = False
+        # dispatches waiting on the current route are told when it ends instead of polling for it
+        self.route_listeners: list = []
 
     def set_sprite(self, sprite: Sprite, hit_box: pygame.Vector2) -> None:
         self.sprite = sprite
@@ -38,8 +38,7 @@ class Player(Entity):
             self.facing = self.velocity
             self.moving = True
 
-    def update(self, entities: list[Entity], map_elements: list[MapElement], ui_manager: UIManager, dt: float)\
-            -> None:
+    def update(self, occupancy: OccupancyGrid, ui_manager: UIManager, dt: float) -> None:
         self.sprite.set(dir_to_str(self.velocity, self.facing))
         self.sprite.update(dt)
 
@@ -51,19 +50,11 @@ class Player(Entity):
 
         target_grid_pos: pygame.Vector2 = self.grid_pos + self.velocity
         rect: pygame.Rect = pygame.Rect(target_grid_pos, self.hit_box)
-        for entity in entities:
-            if entity.get_collision(rect):
-                self.moving = False
-                self.velocity = pygame.Vector2(0, 0)
-                self.move_time = 0
-                return
-
-        for map_element in map_elements:
-            if map_element.get_collision(rect):
-                self.moving = False
-                self.velocity = pygame.Vector2(0, 0)
-                self.move_time = 0
-                return
+        if occupancy.entity_collision(rect) or occupancy.static_collision(rect):
+            self.moving = False
+            self.velocity = pygame.Vector2(0, 0)
+            self.move_time = 0
+            return
         
         self.move_time += dt
         t: float = min(self.move_time / self.move_duration, 1.0)
@@ -104,9 +95,8 @@ class Player(Entity):
                 if self.route_waypoint >= len(self.routes.get(self.current_route).waypoints):
                     self.route_waypoint = 0
                     self.current_route = None
+                    listeners, self.route_listeners = self.route_listeners, []
+                    for listener in listeners:
+                        listener()
         elif self.current_route is None and self.waypoint_wait_time == 0:
-            self.controls_disabled = False
-
-    def render(self, surface: pygame.Surface) -> None:
-        centered: pygame.Vector2 = self.pos - self.sprite.dimensions / 2
-        surface.blit(self.sprite.get() or AssetManager.NULL_IMAGE, Camera.world_pos_to_view_pos(centered))
\ No newline at end of file
+            self.controls_disabled = False
\ No newline at end of file
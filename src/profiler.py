@@ -0,0 +1,96 @@
+import csv
+import time
+
+HISTORY_SIZE = 240
+
+
+class Profiler:
+    ENABLED: bool = False
+
+    TOTALS: dict[str, float] = {}
+    COUNTS: dict[str, int] = {}
+    STARTS: dict[str, float] = {}
+
+    # ring buffer of the last HISTORY_SIZE frames, HEAD is the slot the next frame is written to
+    FRAME_TOTALS: dict[str, float] = {}
+    FRAME_TIMES: list[float] = [0.0] * HISTORY_SIZE
+    SAMPLES: dict[str, list[float]] = {}
+    HEAD: int = 0
+    FILLED: int = 0
+    LAST_FRAME: float = 0
+
+    @classmethod
+    def enable(cls) -> None:
+        cls.ENABLED = True
+        cls.reset()
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.ENABLED = False
+        cls.STARTS.clear()
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.TOTALS.clear()
+        cls.COUNTS.clear()
+        cls.STARTS.clear()
+        cls.FRAME_TOTALS.clear()
+        cls.FRAME_TIMES = [0.0] * HISTORY_SIZE
+        cls.SAMPLES.clear()
+        cls.HEAD = 0
+        cls.FILLED = 0
+        cls.LAST_FRAME = time.perf_counter()
+
+    @classmethod
+    def start(cls, phase: str) -> None:
+        if not cls.ENABLED: return
+        cls.STARTS[phase] = time.perf_counter()
+
+    @classmethod
+    def stop(cls, phase: str) -> None:
+        # a phase that was already running when profiling got switched on has no start to measure from
+        if not cls.ENABLED or (start := cls.STARTS.pop(phase, None)) is None: return
+        elapsed: float = time.perf_counter() - start
+        cls.TOTALS[phase] = cls.TOTALS.get(phase, 0) + elapsed
+        cls.COUNTS[phase] = cls.COUNTS.get(phase, 0) + 1
+        cls.FRAME_TOTALS[phase] = cls.FRAME_TOTALS.get(phase, 0) + elapsed
+
+    @classmethod
+    def end_frame(cls) -> None:
+        if not cls.ENABLED: return
+        now: float = time.perf_counter()
+        cls.FRAME_TIMES[cls.HEAD] = now - cls.LAST_FRAME
+        cls.LAST_FRAME = now
+
+        for phase in cls.FRAME_TOTALS:
+            if phase not in cls.SAMPLES:
+                cls.SAMPLES[phase] = [0.0] * HISTORY_SIZE
+        for phase, samples in cls.SAMPLES.items():
+            samples[cls.HEAD] = cls.FRAME_TOTALS.get(phase, 0)
+        cls.FRAME_TOTALS.clear()
+
+        cls.HEAD = (cls.HEAD + 1) % HISTORY_SIZE
+        cls.FILLED = min(cls.FILLED + 1, HISTORY_SIZE)
+
+    @classmethod
+    def history(cls, samples: list[float]) -> list[float]:
+        ordered: list[float] = samples[cls.HEAD:] + samples[:cls.HEAD]
+        return ordered[HISTORY_SIZE - cls.FILLED:]
+
+    @classmethod
+    def dump_csv(cls, path: str) -> None:
+        phases: list[str] = list(cls.SAMPLES)
+        columns: list[list[float]] = [cls.history(cls.SAMPLES[phase]) for phase in phases]
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "frame_ms"] + [f"{phase}_ms" for phase in phases])
+            for i, frame_time in enumerate(cls.history(cls.FRAME_TIMES)):
+                writer.writerow([i, f"{frame_time * 1000:.3f}"] + [f"{column[i] * 1000:.3f}" for column in columns])
+
+    @classmethod
+    def report(cls, frames: int) -> str:
+        lines: list[str] = [f"{'phase':<16}{'calls':>8}{'total ms':>12}{'ms/frame':>12}"]
+        for phase, total in cls.TOTALS.items():
+            lines.append(f"{phase:<16}{cls.COUNTS[phase]:>8}{total * 1000:>12.2f}{total * 1000 / frames:>12.3f}")
+        return "\n".join(lines)
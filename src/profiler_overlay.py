@@ -0,0 +1,109 @@
+import time
+
+import pygame
+
+from src.asset_manager import AssetManager
+from src.dirty_rects import DirtyRects
+from src.profiler import Profiler
+
+OVERLAY_POS = pygame.Vector2(10, 10)
+OVERLAY_WIDTH = 300
+OVERLAY_PADDING = 8
+GRAPH_HEIGHT = 60
+GRAPH_MAX_MS = 33.3
+TEXT_REFRESH_FRAMES = 15
+
+BACKGROUND_COLOR = (16, 16, 16)
+GRAPH_COLOR = (80, 220, 80)
+BUDGET_COLOR = (120, 60, 60)
+TEXT_COLOR = (230, 230, 230)
+
+DISPLAY_PHASES = [
+    "input", "update", "scene_update", "scene_prefetch", "triggers", "dispatch_chains", "entities", "dialogue",
+    "render", "scene_render", "render_text"
+]
+
+
+class ProfilerOverlay:
+    VISIBLE: bool = False
+    STALE: bool = False
+
+    TEXT: list[pygame.Surface] = []
+    TEXT_AGE: int = 0
+
+    @classmethod
+    def input(cls, events: list[pygame.event.Event]) -> None:
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_F3:
+                cls.toggle()
+            elif event.key == pygame.K_F4 and Profiler.ENABLED:
+                Profiler.dump_csv(time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+
+    @classmethod
+    def toggle(cls) -> None:
+        cls.VISIBLE = not cls.VISIBLE
+        cls.STALE = True
+        cls.TEXT = []
+        if cls.VISIBLE:
+            Profiler.enable()
+        else:
+            Profiler.disable()
+            DirtyRects.taint()
+
+    @classmethod
+    def needs_redraw(cls) -> bool:
+        stale: bool = cls.STALE
+        cls.STALE = False
+        return cls.VISIBLE or stale
+
+    @classmethod
+    def refresh_text(cls) -> None:
+        font: pygame.font.Font = AssetManager.get_font("vcr_osd16")
+        frame_times: list[float] = Profiler.history(Profiler.FRAME_TIMES)
+        average: float = sum(frame_times) / max(len(frame_times), 1)
+
+        lines: list[str] = [f"frame {average * 1000:6.2f} ms  max {max(frame_times, default=0) * 1000:6.2f}"]
+        for phase in DISPLAY_PHASES:
+            if (samples := Profiler.SAMPLES.get(phase, None)) is None:
+                continue
+            history: list[float] = Profiler.history(samples)
+            lines.append(f"{phase:<16}{sum(history) / max(len(history), 1) * 1000:6.2f}"
+                         f"{max(history, default=0) * 1000:7.2f}")
+
+        cls.TEXT = [font.render(line, False, TEXT_COLOR).convert() for line in lines]
+        cls.TEXT_AGE = 0
+
+    @classmethod
+    def draw(cls, surface: pygame.Surface) -> None:
+        if not cls.VISIBLE: return
+
+        if not cls.TEXT or cls.TEXT_AGE >= TEXT_REFRESH_FRAMES:
+            cls.refresh_text()
+        cls.TEXT_AGE += 1
+
+        line_height: int = AssetManager.get_font("vcr_osd16").get_linesize()
+        rect: pygame.Rect = pygame.Rect(OVERLAY_POS, (
+            OVERLAY_WIDTH, GRAPH_HEIGHT + OVERLAY_PADDING * 3 + line_height * len(cls.TEXT)
+        ))
+        # the background is opaque, so redrawing over last frame's overlay never accumulates
+        surface.fill(BACKGROUND_COLOR, rect)
+
+        graph: pygame.Rect = pygame.Rect(rect.x + OVERLAY_PADDING, rect.y + OVERLAY_PADDING,
+                                         rect.width - OVERLAY_PADDING * 2, GRAPH_HEIGHT)
+        budget_y: float = graph.bottom - graph.height * min(16.7 / GRAPH_MAX_MS, 1)
+        pygame.draw.line(surface, BUDGET_COLOR, (graph.left, budget_y), (graph.right, budget_y))
+
+        frame_times: list[float] = Profiler.history(Profiler.FRAME_TIMES)
+        if len(frame_times) > 1:
+            step: float = graph.width / (len(frame_times) - 1)
+            pygame.draw.lines(surface, GRAPH_COLOR, False, [
+                (graph.left + i * step, graph.bottom - graph.height * min(frame_time * 1000 / GRAPH_MAX_MS, 1))
+                for i, frame_time in enumerate(frame_times)
+            ])
+
+        y: int = graph.bottom + OVERLAY_PADDING
+        surface.blits([(text, (graph.left, y + i * line_height)) for i, text in enumerate(cls.TEXT)], doreturn=False)
+
+        DirtyRects.mark(rect)
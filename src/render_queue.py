@@ -0,0 +1,48 @@
+import pygame
+
+
+class RenderQueue:
+    def __init__(self):
+        # [sort_key, surface, dest, owner, frame], kept in last frame's draw order
+        self.entries: list[list] = []
+        self.slots: dict[object, list] = {}
+        self.frame: int = 0
+        self.blits: list[tuple[pygame.Surface, tuple[float, float]]] = []
+
+    def submit(self, owner, surface: pygame.Surface, dest: tuple[float, float], sort_key: float) -> None:
+        entry: list | None = self.slots.get(owner, None)
+        if entry is None:
+            entry = [sort_key, surface, dest, owner, self.frame]
+            self.slots[owner] = entry
+            self.entries.append(entry)
+            return
+
+        entry[0] = sort_key
+        entry[1] = surface
+        entry[2] = dest
+        entry[4] = self.frame
+
+    def sort(self) -> list[tuple[pygame.Surface, tuple[float, float]]]:
+        entries: list[list] = self.entries
+        if any(entry[4] != self.frame for entry in entries):
+            for entry in entries:
+                if entry[4] != self.frame:
+                    del self.slots[entry[3]]
+            entries = [entry for entry in entries if entry[4] == self.frame]
+            self.entries = entries
+
+        # the order barely changes between frames, so insertion sort is close to linear here
+        for i in range(1, len(entries)):
+            entry: list = entries[i]
+            j: int = i - 1
+            while j >= 0 and entries[j][0] > entry[0]:
+                entries[j + 1] = entries[j]
+                j -= 1
+            entries[j + 1] = entry
+
+        self.blits = [(entry[1], entry[2]) for entry in entries]
+        self.frame += 1
+        return self.blits
+
+    def flush(self, surface: pygame.Surface) -> None:
+        surface.blits(self.blits, doreturn=False)
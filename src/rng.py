@@ -0,0 +1,24 @@
+import random
+
+
+class RNG:
+    SEED: int = 0
+    RANDOM: random.Random = random.Random(0)
+
+    @classmethod
+    def seed(cls, seed: int | None = None) -> int:
+        cls.SEED = seed if seed is not None else random.randrange(2 ** 32)
+        cls.RANDOM.seed(cls.SEED)
+        return cls.SEED
+
+    @classmethod
+    def uniform(cls, a: float, b: float) -> float:
+        return cls.RANDOM.uniform(a, b)
+
+    @classmethod
+    def randint(cls, a: int, b: int) -> int:
+        return cls.RANDOM.randint(a, b)
+
+    @classmethod
+    def choice(cls, seq: list):
+        return cls.RANDOM.choice(seq)
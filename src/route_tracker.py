@@ -1,21 +1,59 @@
 class Flags:
-    DEFINED: dict[str, bool] = {}
+    # flag names are interned to single bits, so the whole flag state is one integer
+    BITS: dict[str, int] = {}
+    STATE: int = 0
+    # reverse index from a flag bit to every Conditions that reads it
+    DEPENDENTS: dict[int, list] = {}
+
+    @classmethod
+    def intern(cls, flag: str) -> int:
+        if (bit := cls.BITS.get(flag, None)) is None:
+            bit = 1 << len(cls.BITS)
+            cls.BITS[flag] = bit
+        return bit
+
+    @classmethod
+    def mask(cls, flags: list[str]) -> int:
+        mask: int = 0
+        for flag in flags:
+            mask |= cls.intern(flag)
+        return mask
+
+    @classmethod
+    def depend(cls, mask: int, conditions) -> None:
+        while mask:
+            bit: int = mask & -mask
+            cls.DEPENDENTS.setdefault(bit, []).append(conditions)
+            mask ^= bit
 
     @classmethod
     def is_set(cls, flag: str) -> bool:
-        return cls.DEFINED.get(flag, False)
+        return cls.STATE & cls.intern(flag) != 0
+
+    @classmethod
+    def _store(cls, state: int) -> None:
+        changed: int = state ^ cls.STATE
+        if not changed:
+            return
+
+        cls.STATE = state
+        while changed:
+            bit: int = changed & -changed
+            for conditions in cls.DEPENDENTS.get(bit, []):
+                conditions.refresh()
+            changed ^= bit
 
     @classmethod
     def set(cls, flag: str) -> None:
-        cls.DEFINED[flag] = True
+        cls._store(cls.STATE | cls.intern(flag))
 
     @classmethod
     def clear(cls, flag: str) -> None:
-        cls.DEFINED[flag] = False
+        cls._store(cls.STATE & ~cls.intern(flag))
 
     @classmethod
     def toggle(cls, flag: str) -> None:
-        cls.DEFINED[flag] = not cls.DEFINED.get(flag, False)
+        cls._store(cls.STATE ^ cls.intern(flag))
 
     @classmethod
     def modify(cls, flag: str, how: str) -> None:
@@ -35,22 +73,31 @@ class Conditions:
         self.any_flags: list[str] = any_flags
         self.not_flags: list[str] = not_flags
 
-    def satisfied(self) -> bool:
-        for flag in self.all_flags:
-            if not Flags.is_set(flag):
-                return False
+        self.all_mask: int = Flags.mask(all_flags)
+        self.any_mask: int = Flags.mask(any_flags)
+        self.not_mask: int = Flags.mask(not_flags)
 
-        found: bool = len(self.any_flags) == 0
-        for flag in self.any_flags:
-            if Flags.is_set(flag):
-                found = True
-                break
+        # the result is pushed by Flags whenever one of the flags read here changes, never polled
+        self.result: bool = self.evaluate()
+        Flags.depend(self.all_mask | self.any_mask | self.not_mask, self)
 
-        if not found:
-            return False
+    def evaluate(self) -> bool:
+        state: int = Flags.STATE
+        return state & self.all_mask == self.all_mask and \
+            (self.any_mask == 0 or state & self.any_mask != 0) and \
+            state & self.not_mask == 0
 
-        for flag in self.not_flags:
-            if Flags.is_set(flag):
-                return False
+    def refresh(self) -> None:
+        self.result = self.evaluate()
+
+    def satisfied(self) -> bool:
+        return self.result
+
+class AlwaysConditions(Conditions):
+    def __init__(self):
+        super().__init__([], [], [])
+
+    def satisfied(self) -> bool:
+        return True
 
-        return True
\ No newline at end of file
+ALWAYS: Conditions = AlwaysConditions()
@@ -1,15 +1,26 @@
+import math
+
 import pygame
 
+from src.asset_manager import AssetManager
 from src.camera import Camera
 from src.config import Config
 from src.dialogue import Dialogue
+from src.dirty_rects import DirtyRects
+from src.dispatch_scheduler import DispatchScheduler
 from src.entity import Entity
 from src.event import DispatchChain
 from src.interactable import Interactable
 from src.map_element import MapElement
+from src.map_layer import MapLayer
+from src.occupancy_grid import OccupancyGrid
 from src.player import Player
+from src.profiler import Profiler
+from src.render_queue import RenderQueue
 from src.scene_in_out import SceneEntrance, SceneExit
+from src.spatial_index import SpatialIndex
 from src.trigger import Trigger
+from src.trigger_index import TriggerIndex
 from src.ui_manager import UIManager
 from src.event import SceneState
 
@@ -23,25 +34,51 @@ class Scene:
                  entities: dict[str, Entity],
                  triggers: dict[str, Trigger],
                  entrances: dict[str, SceneEntrance],
-                 exits: list[SceneExit]
+                 exits: list[SceneExit],
+                 assets: list[tuple[str, str]]
                  ):
         self.void_color: tuple[int, int, int, int] = void_color
+        # assets the scene refers to are kept out of AssetManager eviction while it is loaded
+        self.assets: list[tuple[str, str]] = assets
+        self.assets_pinned: bool = False
         self.background_music: pygame.mixer.Sound = background_music
         self.bounds: pygame.Vector2 = bounds
 
         self.map_elements: list[MapElement] = map_elements
+        self.map_layer: MapLayer = MapLayer(self.map_elements)
+        self.upright_index: SpatialIndex = SpatialIndex()
+        for map_element in self.map_elements:
+            if map_element.upright:
+                world_rect: pygame.Rect = map_element.world_rect()
+                self.upright_index.insert(map_element, pygame.Rect(
+                    world_rect.x // Config.TILE_SIZE, world_rect.y // Config.TILE_SIZE,
+                    world_rect.w // Config.TILE_SIZE + 1, world_rect.h // Config.TILE_SIZE + 1
+                ))
+
+        self.occupancy: OccupancyGrid = OccupancyGrid(self.bounds, [
+            map_element.rect for map_element in self.map_elements if map_element.collision
+        ])
 
         self.player: Player = player
         self.entities_dict: dict[str, Entity] = entities
-        self.entities: list[Entity] = []
-        self.entities.append(self.player)
+        self.occupancy.place(self.player, self.player.occupancy_rect())
+        # every loaded entity except the player, interactables are also hashed by tile for interaction lookups
+        self.actors: list[Entity] = []
+        self.interactables: list[Interactable] = []
+        self.interactable_index: SpatialIndex = SpatialIndex(cell_size=1)
+        self.entity_index: SpatialIndex = SpatialIndex()
+        self.cull_margin: int = 1
         self.dialogue: Dialogue | None = None
 
         self.triggers: dict[str, Trigger] = triggers
+        self.trigger_index: TriggerIndex = TriggerIndex(self.triggers, self.entities_dict)
 
         self.entrances: dict[str, SceneEntrance] = entrances
         self.entering_through: SceneEntrance | None = None
         self.exits: list[SceneExit] = exits
+        self.exit_index: SpatialIndex = SpatialIndex(cell_size=1)
+        for scene_exit in self.exits:
+            self.exit_index.insert(scene_exit, scene_exit.rect)
         self.exiting_through: SceneExit | None = None
 
         self.state: SceneState = SceneState.EXITED
@@ -50,26 +87,63 @@ class Scene:
         self.void_surface.fill(self.void_color[:3])
         self.void_surface.set_alpha(self.void_color[3])
 
-        self.dispatch_chains: set[DispatchChain] = set()
-        self.added_dispatch_chains: set[DispatchChain] = set()
-        self.removed_dispatch_chains: set[DispatchChain] = set()
+        self.render_queue: RenderQueue = RenderQueue()
+        self.rendered_camera: tuple[float, float] | None = None
+        self.rendered_sprites: list[tuple[pygame.Surface, tuple[float, float]]] = []
+        self.rendered_dialogue_fade: float = -1
+
+        self.dispatch_scheduler: DispatchScheduler = DispatchScheduler()
 
     def add_dispatch_chain(self, chain: DispatchChain):
-        self.added_dispatch_chains.add(chain)
+        self.dispatch_scheduler.add(chain)
         chain.start(self)
 
     def remove_dispatch_chain(self, chain: DispatchChain):
-        self.removed_dispatch_chains.add(chain)
+        self.dispatch_scheduler.remove(chain)
+
+    def add_entity(self, entity: Entity) -> None:
+        self.actors.append(entity)
+        self.entity_index.insert(entity, entity.occupancy_rect())
+        if entity.collision:
+            self.occupancy.place(entity, entity.occupancy_rect())
+        if isinstance(entity, Interactable):
+            self.interactables.append(entity)
+            self.interactable_index.insert(entity, entity.occupancy_rect())
+        self.cull_margin = max(self.cull_margin,
+                               math.ceil(max(entity.sprite.dimensions) / Config.TILE_SIZE) + 1)
+
+    def remove_entity(self, entity: Entity) -> None:
+        self.actors.remove(entity)
+        self.entity_index.remove(entity)
+        self.occupancy.remove(entity)
+        if isinstance(entity, Interactable):
+            self.interactables.remove(entity)
+            self.interactable_index.remove(entity)
+
+    def view_rect(self) -> pygame.Rect:
+        return pygame.Rect(
+            Camera.RENDER_POS.x // Config.TILE_SIZE, Camera.RENDER_POS.y // Config.TILE_SIZE,
+            Config.WINDOW_DIMS.x // Config.TILE_SIZE + 1, Config.WINDOW_DIMS.y // Config.TILE_SIZE + 1
+        )
+
+    def visible_entities(self) -> list[Entity]:
+        return self.entity_index.query(self.view_rect().inflate(self.cull_margin * 2, self.cull_margin * 2))
 
     def load(self, entrance: str, player_face_dir: pygame.Vector2, from_continue: bool) -> None:
         if self.state != SceneState.EXITED: return
         self.state = SceneState.ENTERED
+        self.pin_assets()
         self.background_music.play(loops=-1, fade_ms=BACKGROUND_MUSIC_FADE_MS)
 
+        if not self.map_layer.baked:
+            self.map_layer.bake()
+
         if from_continue:
             return
 
         Camera.TRACK = self.player
+        Camera.snap()
+        self.trigger_index.reset()
 
         if self.entrances.get(entrance, None) is not None:
             self.player.grid_pos = self.entrances.get(entrance).spawn.copy()
@@ -77,20 +151,32 @@ class Scene:
             self.state = SceneState.ENTERING
         self.player.pos = self.player.grid_pos * Config.TILE_SIZE
         self.player.facing = player_face_dir.copy()
+        self.occupancy.move(self.player, self.player.occupancy_rect())
 
         if self.has_loaded_prev:
             return
 
         for _, entity in self.entities_dict.items():
             if entity.load():
-                self.entities.append(entity)
+                self.add_entity(entity)
 
         self.has_loaded_prev = True
 
     def unload(self) -> None:
         self.state = SceneState.EXITED
+        self.unpin_assets()
         self.background_music.fadeout(BACKGROUND_MUSIC_FADE_MS)
 
+    def pin_assets(self) -> None:
+        if not self.assets_pinned:
+            AssetManager.pin(self.assets)
+            self.assets_pinned = True
+
+    def unpin_assets(self) -> None:
+        if self.assets_pinned:
+            AssetManager.unpin(self.assets)
+            self.assets_pinned = False
+
     def input(self, ui_manager: UIManager, keys: pygame.key.ScancodeWrapper) -> None:
         if self.dialogue is not None:
             self.dialogue.input(self, keys)
@@ -103,11 +189,9 @@ class Scene:
         self.player.input(keys)
 
         if not (keys[pygame.K_SPACE] or keys[pygame.K_RETURN]): return
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                continue
-            entity.input(keys)
-            if isinstance(entity, Interactable) and entity.can_interact(self.player):
+        facing: pygame.Rect = pygame.Rect(self.player.grid_pos + self.player.facing, (1, 1))
+        for entity in self.interactable_index.query(facing):
+            if entity.can_interact(self.player):
                 self.dialogue = entity.interact(self.player)
                 if self.dialogue is not None:
                     if self.dialogue.start(self):
@@ -115,7 +199,7 @@ class Scene:
                     else:
                         self.background_music.set_volume(self.background_music.get_volume() / 3)
 
-        for scene_exit in self.exits:
+        for scene_exit in self.exit_index.query(facing):
             if not scene_exit.available():
                 continue
             if scene_exit.can_interact(self.player):
@@ -135,16 +219,16 @@ class Scene:
             self.exiting_through = None
             return
 
-        self.dispatch_chains.update(self.added_dispatch_chains)
-        self.added_dispatch_chains.clear()
-        for chain in self.dispatch_chains:
-            chain.update(self, dt)
-        self.dispatch_chains = self.dispatch_chains.difference(self.removed_dispatch_chains)
-        self.removed_dispatch_chains.clear()
+        Profiler.start("dispatch_chains")
+        self.dispatch_scheduler.update(self, dt)
+        Profiler.stop("dispatch_chains")
 
-        for _, trigger in self.triggers.items():
+        Profiler.start("triggers")
+        # triggers are only evaluated when something they catch on may have changed
+        for trigger in self.trigger_index.collect(self):
             if trigger.catch(self):
                 trigger.dispatch(self)
+        Profiler.stop("triggers")
 
         if self.entering_through is not None:
             self.entering_through.update(manager, dt)
@@ -160,15 +244,19 @@ class Scene:
                 self.state = SceneState.EXITED
             return
 
-        self.player.update(self.entities, self.map_elements, ui_manager, dt)
+        Profiler.start("player")
+        self.player.snapshot()
+        self.player.update(self.occupancy, ui_manager, dt)
         self.player.grid_pos.x = pygame.math.clamp(self.player.grid_pos.x, 0, self.bounds.x)
         self.player.grid_pos.y = pygame.math.clamp(self.player.grid_pos.y, 0, self.bounds.y)
         self.player.pos.x = pygame.math.clamp(self.player.pos.x, 0,
                                               self.bounds.x * Config.TILE_SIZE - self.player.sprite.dimensions.x)
         self.player.pos.y = pygame.math.clamp(self.player.pos.y, 0,
                                               self.bounds.y * Config.TILE_SIZE - self.player.sprite.dimensions.y)
+        self.occupancy.move(self.player, self.player.occupancy_rect())
+        Profiler.stop("player")
 
-        for scene_exit in self.exits:
+        for scene_exit in self.exit_index.query(pygame.Rect(self.player.grid_pos, (1, 1))):
             if not scene_exit.available():
                 continue
             if scene_exit.entered(self.player.grid_pos):
@@ -177,7 +265,9 @@ class Scene:
                 break
 
         if self.dialogue is not None:
+            Profiler.start("dialogue")
             self.dialogue.update(ui_manager, self, dt)
+            Profiler.stop("dialogue")
             if self.dialogue.fade == 0:
                 self.dialogue.reset()
                 self.dialogue = None
@@ -185,20 +275,58 @@ class Scene:
 
         ui_manager.update()
 
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                continue
-            entity.update(self.entities, self.map_elements, ui_manager, dt)
+        Profiler.start("entities")
+        for entity in self.actors:
+            # grid_pos can only change while an entity is moving along a route
+            tracked: bool = entity.moving or entity.current_route is not None
+            entity.snapshot()
+            entity.update(self.occupancy, ui_manager, dt)
+            if tracked:
+                rect: pygame.Rect = entity.occupancy_rect()
+                self.entity_index.move(entity, rect)
+                if entity in self.interactable_index:
+                    self.interactable_index.move(entity, rect)
+                self.trigger_index.entity_moved(entity)
+                if entity.collision:
+                    self.occupancy.move(entity, rect)
+        Profiler.stop("entities")
+
+    def mark_dirty(self, sprites: list[tuple[pygame.Surface, tuple[float, float]]], dialogue_fade: float) -> bool:
+        camera: tuple[float, float] = (Camera.RENDER_POS.x, Camera.RENDER_POS.y)
+
+        repaint: bool = True
+        if DirtyRects.REPAINT or camera != self.rendered_camera or dialogue_fade != self.rendered_dialogue_fade \
+                or dialogue_fade not in (-1, 255):
+            DirtyRects.mark_full()
+        elif sprites == self.rendered_sprites:
+            repaint = False
+        else:
+            for image, pos in set(sprites).symmetric_difference(self.rendered_sprites):
+                DirtyRects.mark(image.get_rect(topleft=pos))
+
+        self.rendered_camera = camera
+        self.rendered_sprites = sprites
+        self.rendered_dialogue_fade = dialogue_fade
+        return repaint
 
     def render(self, window_surface: pygame.Surface, ui_manager: UIManager) -> None:
-        window_surface.fill((0, 0, 0))
-        window_surface.blit(self.void_surface, (0, 0))
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                continue
-            entity.render(window_surface)
-        for map_element in self.map_elements: map_element.render(window_surface)
-        self.player.render(window_surface)
+        Camera.interpolate()
+        for entity in self.visible_entities():
+            entity.submit(self.render_queue)
+        self.player.submit(self.render_queue)
+        for map_element in self.upright_index.query(self.view_rect()):
+            map_element.submit(self.render_queue)
+        sprites: list[tuple[pygame.Surface, tuple[float, float]]] = self.render_queue.sort()
+
+        repaint: bool = True
+        if Config.DIRTY_RECTS:
+            repaint = self.mark_dirty(sprites, self.dialogue.fade if self.dialogue is not None else -1)
+
+        if repaint:
+            window_surface.fill((0, 0, 0))
+            window_surface.blit(self.void_surface, (0, 0))
+            self.map_layer.render(window_surface)
+            self.render_queue.flush(window_surface)
 
         if self.dialogue is not None:
             dims: pygame.Rect = pygame.Rect(
@@ -1,13 +1,17 @@
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from src.asset_manager import AssetManager, AUDIO_ASSET, FONT_ASSET, IMAGE_ASSET, SPRITE_ASSET
 from src.dialogue import Monologue, Dialogue, MonologueOption, MonologueLine
+from src.dirty_rects import DirtyRects
 from src.entity import Entity
 from src.entity_route import Waypoint
 from src.event import *
 from src.map_element import MapElement
 from src.npc import NPC
 from src.player import Player
-from src.route_tracker import Conditions
+from src.profiler import Profiler
+from src.route_tracker import Conditions, ALWAYS
 from src.scene import Scene
 from src.scene_in_out import SceneEntrance, SceneExit, str_to_scene_transition
 from src.sprite import Sprite, copy_sprite
@@ -20,6 +24,10 @@ def parse_conditions(conditions_obj: dict) -> Conditions:
     any_flags: list[str] = [flag for flag in conditions_obj.get("any", [])]
     not_flags: list[str] = [flag for flag in conditions_obj.get("not", [])]
 
+    # most conditions are empty, they all share one object that is always satisfied
+    if not all_flags and not any_flags and not not_flags:
+        return ALWAYS
+
     return Conditions(all_flags=all_flags, any_flags=any_flags, not_flags=not_flags)
 
 def parse_entity_route(route_obj: dict) -> EntityRoute:
@@ -246,6 +254,35 @@ def parse_dialogue(dialogue_obj: dict, entity_id: str) -> Dialogue:
     )
 
 
+def read_scene(path: str) -> dict:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def scene_asset_refs(scene_obj: dict) -> list[tuple[str, str]]:
+    refs: set[tuple[str, str]] = {(AUDIO_ASSET, scene_obj.get("background_music", {}).get("identifier", ""))}
+    for map_element_obj in scene_obj.get("map_elements", []):
+        refs.add((IMAGE_ASSET, map_element_obj.get("image", "")))
+    for lookup_entry_obj in scene_obj.get("entity_lookup", []):
+        refs.add((SPRITE_ASSET, lookup_entry_obj.get("sprite", "")))
+
+    # monologues and audio dispatches can sit in entity dialogues and triggers at any depth
+    stack: list = [scene_obj.get("entities", []), scene_obj.get("triggers", [])]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, list):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            refs.add((IMAGE_ASSET, obj.get("speaker_image", "")))
+            refs.add((AUDIO_ASSET, obj.get("speaking_sfx", "")))
+            refs.add((FONT_ASSET, obj.get("font", "")))
+            if obj.get("name", "") == "play_audio":
+                refs.add((AUDIO_ASSET, obj.get("identifier", "")))
+            stack.extend(obj.values())
+
+    return [ref for ref in refs if ref[1] != ""]
+
+
 def parse_scene(scene_obj: dict) -> Scene:
     void_color_obj: dict = scene_obj.get("void_color", {})
     void_color: tuple[int, int, int, int] = (
@@ -276,9 +313,11 @@ def parse_scene(scene_obj: dict) -> Scene:
     entity_lookup: dict = {}
     entity_lookup_obj: list = scene_obj.get("entity_lookup", [])
     for lookup_entry_obj in entity_lookup_obj:
-        sprite: Sprite = copy_sprite(AssetManager.get_sprite(lookup_entry_obj.get("sprite", "")))
-        sprite.set_default_anim(lookup_entry_obj.get("default_animation", ""))
-        sprite.set_frame_time(lookup_entry_obj.get("animation_frame_time", 0))
+        sprite: Sprite = Sprite(
+            data=AssetManager.get_sprite(lookup_entry_obj.get("sprite", "")),
+            default_anim=lookup_entry_obj.get("default_animation", ""),
+            frame_time=lookup_entry_obj.get("animation_frame_time", 0)
+        )
 
         entity_lookup[lookup_entry_obj.get("id")] = (
             sprite,
@@ -384,7 +423,8 @@ def parse_scene(scene_obj: dict) -> Scene:
         entities=entities,
         triggers=triggers,
         entrances=entrances,
-        exits=exits
+        exits=exits,
+        assets=scene_asset_refs(scene_obj)
     )
 
     return scene
@@ -393,6 +433,7 @@ def parse_scene(scene_obj: dict) -> Scene:
 class SceneManager:
     def __init__(self, scene_guide: str):
         self.scenes: dict[str, Scene] = {}
+        self.scene_paths: dict[str, str] = {}
         self.current_scene: str = ""
         self.start_scene: str = ""
 
@@ -407,30 +448,72 @@ class SceneManager:
 
         self.start_scene = obj.get("start_scene", "")
         for scene_obj in obj.get("scenes", []):
-            with open(scene_obj.get("path"), "r") as file:
-                scene_json = json.load(file)
-            self.add_scene(scene_obj.get("name"), parse_scene(scene_json))
+            self.scene_paths[scene_obj.get("name")] = scene_obj.get("path")
+
+        # scenes are parsed on first use, neighbours of the current scene are read ahead on a worker thread
+        self.prefetcher: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene_prefetch")
+        self.prefetched: dict[str, Future] = {}
 
     def add_scene(self, name: str, scene: Scene) -> None:
         self.scenes[name] = scene
 
+    def get_scene(self, name: str) -> Scene:
+        if (scene := self.scenes.get(name, None)) is not None:
+            return scene
+
+        future: Future | None = self.prefetched.pop(name, None)
+        scene_json: dict = future.result() if future is not None else read_scene(self.scene_paths[name])
+        # pinned before decoding so the scene's own assets can not evict each other, Scene.load keeps the pins
+        assets: list[tuple[str, str]] = scene_asset_refs(scene_json)
+        AssetManager.pin(assets)
+        AssetManager.preload(assets)
+        self.add_scene(name, parse_scene(scene_json))
+        self.scenes[name].assets_pinned = True
+        return self.scenes[name]
+
+    def prefetch(self, name: str) -> None:
+        if name in self.scenes or name in self.prefetched or name not in self.scene_paths:
+            return
+        self.prefetched[name] = self.prefetcher.submit(read_scene, self.scene_paths[name])
+
+    def parse_prefetched(self) -> None:
+        # parsing touches flags, surfaces and sounds, so it stays on the main thread, one scene per step at most
+        for name, future in self.prefetched.items():
+            if future.done():
+                # a neighbour is only read ahead, its assets stay evictable until it is entered
+                self.get_scene(name).unpin_assets()
+                return
+
     def load_scene(self, scene_name: str, entrance_id: str, player_face_dir: pygame.Vector2,
                    from_continue: bool = False) -> None:
         if self.current_scene != "":
             self.scenes[self.current_scene].unload()
-        self.scenes[scene_name].load(entrance_id, player_face_dir, from_continue)
+        self.get_scene(scene_name).load(entrance_id, player_face_dir, from_continue)
         self.current_scene = scene_name
 
+        for scene_exit in self.scenes[scene_name].exits:
+            self.prefetch(scene_exit.next_scene)
+
     def input(self, ui_manager: UIManager, keys: pygame.key.ScancodeWrapper) -> None:
         self.scenes[self.current_scene].input(ui_manager, keys)
 
     def update(self, ui_manager: UIManager, dt: float) -> None:
         self.fade = pygame.math.clamp(self.fade + self.fading * dt, 0, 255)
+        Profiler.start("scene_update")
         self.scenes[self.current_scene].update(ui_manager, dt, self)
+        Profiler.stop("scene_update")
+
+        if self.prefetched:
+            Profiler.start("scene_prefetch")
+            self.parse_prefetched()
+            Profiler.stop("scene_prefetch")
 
     def render(self, window_surface: pygame.Surface, ui_manager: UIManager) -> None:
+        Profiler.start("scene_render")
         self.scenes[self.current_scene].render(window_surface, ui_manager)
+        Profiler.stop("scene_render")
 
         if self.fade > 0:
             self.overlay.set_alpha(self.fade)
-            window_surface.blit(self.overlay, (0, 0))
\ No newline at end of file
+            window_surface.blit(self.overlay, (0, 0))
+            DirtyRects.taint()
\ No newline at end of file
@@ -0,0 +1,78 @@
+import pygame
+
+CELL_SIZE: int = 8
+
+
+class SpatialIndex:
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size: int = cell_size
+        self.cells: dict[tuple[int, int], set] = {}
+        self.placements: dict[object, tuple[int, int, int, int]] = {}
+        self.order: dict[object, int] = {}
+        self.next_order: int = 0
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.placements
+
+    def _cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        return (
+            rect.left // self.cell_size, rect.top // self.cell_size,
+            (rect.left + max(rect.width, 1) - 1) // self.cell_size,
+            (rect.top + max(rect.height, 1) - 1) // self.cell_size
+        )
+
+    def _place(self, obj, cell_range: tuple[int, int, int, int]) -> None:
+        for cell_x in range(cell_range[0], cell_range[2] + 1):
+            for cell_y in range(cell_range[1], cell_range[3] + 1):
+                cell: set | None = self.cells.get((cell_x, cell_y), None)
+                if cell is None:
+                    cell = set()
+                    self.cells[(cell_x, cell_y)] = cell
+                cell.add(obj)
+        self.placements[obj] = cell_range
+
+    def _unplace(self, obj) -> None:
+        cell_range: tuple[int, int, int, int] = self.placements.pop(obj)
+        for cell_x in range(cell_range[0], cell_range[2] + 1):
+            for cell_y in range(cell_range[1], cell_range[3] + 1):
+                cell: set = self.cells[(cell_x, cell_y)]
+                cell.discard(obj)
+                if not cell:
+                    del self.cells[(cell_x, cell_y)]
+
+    def insert(self, obj, rect: pygame.Rect) -> None:
+        if obj in self.placements:
+            self.move(obj, rect)
+            return
+
+        self._place(obj, self._cell_range(rect))
+        self.order[obj] = self.next_order
+        self.next_order += 1
+
+    def move(self, obj, rect: pygame.Rect) -> bool:
+        cell_range: tuple[int, int, int, int] = self._cell_range(rect)
+        if self.placements.get(obj, None) == cell_range:
+            return False
+
+        if obj in self.placements:
+            self._unplace(obj)
+        self._place(obj, cell_range)
+        return True
+
+    def remove(self, obj) -> None:
+        if obj not in self.placements:
+            return
+        self._unplace(obj)
+        del self.order[obj]
+
+    def query(self, rect: pygame.Rect) -> list:
+        cell_range: tuple[int, int, int, int] = self._cell_range(rect)
+
+        found: set = set()
+        for cell_x in range(cell_range[0], cell_range[2] + 1):
+            for cell_y in range(cell_range[1], cell_range[3] + 1):
+                cell: set | None = self.cells.get((cell_x, cell_y), None)
+                if cell is not None:
+                    found.update(cell)
+
+        return sorted(found, key=self.order.__getitem__)
@@ -29,43 +29,15 @@ def dir_to_str(moving: pygame.Vector2, facing: pygame.Vector2) -> str | None:
 DEFAULT_ANIM: str = "idle_down"
 DEFAULT_FRAME_TIME: float = 0.2
 
-class Sprite:
-    def __init__(self, spritesheet: pygame.Surface | None, dimensions: pygame.Vector2,
-                 animations: list[str] | None, row_major: bool | None,
-                 num_frames: int,
-
-                 frames: dict[str, list[pygame.Surface]] | None = None,
-                 default_anim: str | None = None,
-                 frame_time: float | None = None):
-
+class SpriteData:
+    def __init__(self, spritesheet: pygame.Surface, dimensions: pygame.Vector2,
+                 animations: list[str], row_major: bool, num_frames: int):
         self.frames: dict[str, list[pygame.Surface]] = {}
         self.dimensions: pygame.Vector2 = dimensions
         self.num_frames: int = num_frames
 
-        self.default_anim: str = DEFAULT_ANIM
-        self.animation: str = self.default_anim
-
-        self.frame_progress: float = 0
-        self.frame_time: float = DEFAULT_FRAME_TIME
-        self.frame_index: int = 0
-
-        if frames is not None:
-            for k, v in frames.items():
-                self.frames[k] = []
-                for frame in v:
-                    self.frames[k].append(frame.copy())
-            self.default_anim = default_anim
-            self.frame_time = frame_time
-            return
-
         self.init_frames(spritesheet, animations, row_major)
 
-    def set_default_anim(self, anim: str):
-        self.default_anim = anim
-
-    def set_frame_time(self, frame_time: float):
-        self.frame_time = frame_time
-
     def init_frames(self, spritesheet: pygame.Surface, animations: list[str], row_major: bool) -> None:
         elements: int = self.num_frames * len(animations)
 
@@ -96,6 +68,28 @@ class Sprite:
                     x += 1
                     y = 0
 
+
+class Sprite:
+    def __init__(self, data: SpriteData, default_anim: str = DEFAULT_ANIM, frame_time: float = DEFAULT_FRAME_TIME):
+        # frames are shared with every other instance of the same sprite, only animation state is per instance
+        self.data: SpriteData = data
+        self.frames: dict[str, list[pygame.Surface]] = data.frames
+        self.dimensions: pygame.Vector2 = data.dimensions
+        self.num_frames: int = data.num_frames
+
+        self.default_anim: str = default_anim
+        self.animation: str = DEFAULT_ANIM
+
+        self.frame_progress: float = 0
+        self.frame_time: float = frame_time
+        self.frame_index: int = 0
+
+    def set_default_anim(self, anim: str):
+        self.default_anim = anim
+
+    def set_frame_time(self, frame_time: float):
+        self.frame_time = frame_time
+
     def reset_frames(self) -> None:
         self.frame_progress = 0
         self.frame_index = 0
@@ -118,14 +112,8 @@ class Sprite:
             self.frame_index %= self.num_frames
 
 def copy_sprite(sprite: Sprite) -> Sprite:
-    new_sprite: Sprite = Sprite(
-        spritesheet=None,
-        dimensions=sprite.dimensions,
-        animations=None,
-        row_major=None,
-        num_frames=sprite.num_frames,
-        frames=sprite.frames,
+    return Sprite(
+        data=sprite.data,
         default_anim=sprite.default_anim,
         frame_time=sprite.frame_time
     )
-    return new_sprite
\ No newline at end of file
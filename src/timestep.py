@@ -0,0 +1,49 @@
+class Timestep:
+    STEP: float = 1 / 120
+    MAX_STEPS: int = 8
+
+    ACCUMULATOR: float = 0
+    STEPS: int = 0
+    BUDGET: int | None = None
+    TICK: int = 0
+    ALPHA: float = 1
+
+    @classmethod
+    def set_rate(cls, rate: int, max_steps: int) -> None:
+        cls.STEP = 1 / rate
+        cls.MAX_STEPS = max_steps
+
+    @classmethod
+    def begin(cls, frame_time: float, steps: int | None = None) -> None:
+        cls.STEPS = 0
+        cls.BUDGET = steps
+        if steps is None:
+            cls.ACCUMULATOR += frame_time
+
+    @classmethod
+    def consume(cls) -> bool:
+        # a step budget (replays, benchmarks) replaces wall clock time entirely
+        if cls.BUDGET is not None:
+            if cls.STEPS >= cls.BUDGET:
+                return False
+        elif cls.ACCUMULATOR < cls.STEP or cls.STEPS >= cls.MAX_STEPS:
+            return False
+        else:
+            cls.ACCUMULATOR -= cls.STEP
+        cls.STEPS += 1
+        cls.TICK += 1
+        return True
+
+    @classmethod
+    def end(cls) -> None:
+        if cls.BUDGET is not None:
+            cls.ALPHA = 1
+            return
+
+        # time beyond the step cap is dropped instead of carried over, so a long hitch can't snowball
+        cls.ACCUMULATOR %= cls.STEP
+        cls.ALPHA = cls.ACCUMULATOR / cls.STEP
+
+    @classmethod
+    def lerp(cls, prev: float, current: float) -> float:
+        return prev + (current - prev) * cls.ALPHA
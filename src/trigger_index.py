@@ -0,0 +1,74 @@
+import pygame
+
+from src.entity import Entity
+from src.event import CatchEvent, OnPlayerEnter, OnEntityEnter, OnSceneStart, OnSceneExit
+from src.spatial_index import SpatialIndex
+from src.trigger import Trigger
+
+
+class TriggerIndex:
+    def __init__(self, triggers: dict[str, Trigger], entities: dict[str, Entity]):
+        self.order: dict[Trigger, int] = {trigger: i for i, trigger in enumerate(triggers.values())}
+
+        self.player_regions: SpatialIndex = SpatialIndex()
+        self.region_owners: dict[CatchEvent, Trigger] = {}
+        self.entity_watchers: dict[Entity, set[Trigger]] = {}
+        self.state_triggers: set[Trigger] = set()
+        # catch types the index knows nothing about are still evaluated every step, as before
+        self.polled: set[Trigger] = set()
+
+        for trigger in triggers.values():
+            for catch in trigger.catches:
+                if isinstance(catch, OnPlayerEnter):
+                    self.player_regions.insert(catch, catch.rect)
+                    self.region_owners[catch] = trigger
+                elif isinstance(catch, OnEntityEnter):
+                    for identifier in catch.ids:
+                        if (entity := entities.get(identifier, None)) is not None:
+                            self.entity_watchers.setdefault(entity, set()).add(trigger)
+                elif isinstance(catch, (OnSceneStart, OnSceneExit)):
+                    self.state_triggers.add(trigger)
+                else:
+                    self.polled.add(trigger)
+
+        self.entity_rects: dict[Entity, tuple[int, int, int, int]] = {}
+        self.pending: set[Trigger] = set()
+        self.last_state = None
+        self.last_player_tile: tuple[float, float] | None = None
+
+    def reset(self) -> None:
+        self.pending.update(self.order)
+        self.last_state = None
+        self.last_player_tile = None
+
+    def enable(self, trigger: Trigger) -> None:
+        trigger.disabled = False
+        self.pending.add(trigger)
+
+    def entity_moved(self, entity: Entity) -> None:
+        if (watchers := self.entity_watchers.get(entity, None)) is None:
+            return
+
+        rect: tuple[int, int, int, int] = tuple(pygame.Rect(entity.grid_pos, entity.hit_box))
+        if self.entity_rects.get(entity, None) != rect:
+            self.entity_rects[entity] = rect
+            self.pending.update(watchers)
+
+    def collect(self, scene) -> list[Trigger]:
+        if scene.state != self.last_state:
+            self.last_state = scene.state
+            self.pending.update(self.state_triggers)
+
+        player_tile: tuple[float, float] = (scene.player.grid_pos.x, scene.player.grid_pos.y)
+        if player_tile != self.last_player_tile:
+            self.last_player_tile = player_tile
+            for catch in self.player_regions.query(pygame.Rect(player_tile, (1, 1))):
+                self.pending.add(self.region_owners[catch])
+
+        self.pending.update(self.polled)
+        if not self.pending:
+            return []
+
+        triggers: list[Trigger] = sorted(self.pending, key=self.order.__getitem__)
+        self.pending.clear()
+        return triggers
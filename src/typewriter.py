@@ -0,0 +1,63 @@
+import pygame
+
+from src.ui_manager import _line_height, _wrap_lines
+
+
+class Typewriter:
+    def __init__(self, text: str, font: pygame.font.Font, width: int, color: list):
+        self.text: str = text
+        self.font: pygame.font.Font = font
+        self.width: int = width
+        self.color: list = color
+
+        self.spans: list[tuple[int, int]] = _wrap_lines(text, font, width)
+        self.line_height: int = _line_height(font)
+
+        # the surface is lent by the dialogue box and taken back when another typewriter needs it
+        self.surface: pygame.Surface | None = None
+        self.revealed: int = 0
+        self.span_index: int = 0
+
+    def size(self) -> tuple[int, int]:
+        return max(self.width, 1), max(len(self.spans) * self.line_height + self.font.get_height(), 1)
+
+    def attach(self, surface: pygame.Surface) -> None:
+        self.surface = surface
+        self.revealed = 0
+        self.span_index = 0
+
+    def detach(self) -> None:
+        self.surface = None
+        self.revealed = 0
+        self.span_index = 0
+
+    def reset(self) -> None:
+        if self.revealed == 0:
+            return
+
+        if self.surface is not None:
+            self.surface.fill((0, 0, 0, 0), pygame.Rect((0, 0), self.size()))
+        self.revealed = 0
+        self.span_index = 0
+
+    def reveal(self, count: int) -> None:
+        if count < self.revealed:
+            self.reset()
+
+        # finished lines are never touched again, only the line being typed is re-rasterized up to the
+        # newly revealed glyph so kerning and overhanging glyphs come out exactly like a full render
+        while self.revealed < count and self.span_index < len(self.spans):
+            start, end = self.spans[self.span_index]
+            if self.revealed < start:
+                if count <= start:
+                    break
+                self.revealed = start
+
+            stop: int = min(count, end)
+            if stop > self.revealed:
+                self.surface.blit(self.font.render(self.text[start:stop], False, self.color[:3]),
+                                  (0, self.span_index * self.line_height))
+                self.revealed = stop
+
+            if self.revealed >= end:
+                self.span_index += 1
@@ -1,5 +1,11 @@
+from collections import OrderedDict
+
 import pygame
 
+from src.config import Config
+from src.dialogue_box import DialogueBox
+from src.profiler import Profiler
+
 class Text:
     def __init__(self, text: str, color: list, pos: pygame.Vector2, font: pygame.font.Font,
                  align_left: bool = False, align_center: bool = False, align_right: bool = False,
@@ -10,13 +16,15 @@ class Text:
         self.color: list = color
 
         if align_left:
-            self.rect = self.font.render(text, True, color).get_rect()
+            self.rect = pygame.Rect((0, 0), self.font.size(text))
             self.rect.x = self.pos.x
             self.rect.y = self.pos.y
         elif align_center:
-            self.rect = self.font.render(text, True, color).get_rect(center=pos)
+            self.rect = pygame.Rect((0, 0), self.font.size(text))
+            self.rect.center = pos
         elif align_right:
-            self.rect = self.font.render(text, True, color).get_rect(topright=pos)
+            self.rect = pygame.Rect((0, 0), self.font.size(text))
+            self.rect.topright = pos
         else:
             self.rect = pygame.Rect(self.pos.x, self.pos.y, dimensions.x, dimensions.y)
 
@@ -29,39 +37,192 @@ class Button:
         self.select_color: list = select_color
 
 
-def _render_text(text: Text, surface: pygame.Surface) -> None:
-    rect: pygame.Rect = pygame.Rect(text.rect)
-    y: int = rect.top
-    line_spacing: int = -2
-    font_height: int = text.font.size("Tg")[1]
+class TextCache:
+    BUDGET: int = 16 * 1024 * 1024
+    SIZE: int = 0
+    ENTRIES: OrderedDict[tuple, tuple[list[tuple[pygame.Surface, tuple[int, int]]], int]] = OrderedDict()
 
-    write: str = text.text
-    lines: list[str] = write.split("\n")
+    @classmethod
+    def get(cls, text: Text) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        key: tuple = (text.text, text.font, text.rect.width, tuple(text.color[:3]))
+        if (entry := cls.ENTRIES.get(key, None)) is not None:
+            cls.ENTRIES.move_to_end(key)
+            return entry[0]
 
-    blits: list = []
-    for line in lines:
-        while line:
-            i: int = 1
+        lines: list[tuple[pygame.Surface, tuple[int, int]]] = _layout_text(text)
+        size: int = sum(img.get_bytesize() * img.get_width() * img.get_height() for img, _ in lines)
+
+        cls.ENTRIES[key] = (lines, size)
+        cls.SIZE += size
+        while cls.SIZE > cls.BUDGET and len(cls.ENTRIES) > 1:
+            _, (_, evicted_size) = cls.ENTRIES.popitem(last=False)
+            cls.SIZE -= evicted_size
+
+        return lines
 
-            while text.font.size(line[:i])[0] < rect.width and i < len(line):
-                i += 1
+    @classmethod
+    def forget(cls, font) -> None:
+        for key in [key for key in cls.ENTRIES if key[1] is font]:
+            _, size = cls.ENTRIES.pop(key)
+            cls.SIZE -= size
+
+
+def _wrap_index(line: str, font: pygame.font.Font, width: int) -> int:
+    low: int = 1
+    high: int = len(line)
+    while low < high:
+        mid: int = (low + high) // 2
+        if font.size(line[:mid])[0] < width:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def _wrap_lines(text: str, font: pygame.font.Font, width: int) -> list[tuple[int, int]]:
+    spans: list[tuple[int, int]] = []
+
+    offset: int = 0
+    for line in text.split("\n"):
+        start: int = offset
+        while line:
+            i: int = _wrap_index(line, font, width)
 
             if i < len(line):
                 split_idx: int = line.rfind(" ", 0, i)
                 i = split_idx + 1 if split_idx != -1 else i
 
-            img: pygame.Surface = text.font.render(line[:i], False, text.color[:3]).convert()
-            if text.color[3] < 255: img.set_alpha(text.color[3])
-            blits.append((img, (rect.left, y)))
-            y += font_height + line_spacing
+            spans.append((start, start + i))
+            start += i
             line = line[i:]
+        offset = start + 1
+
+    return spans
+
+
+def _line_height(font: pygame.font.Font) -> int:
+    line_spacing: int = -2
+    return font.size("Tg")[1] + line_spacing
+
 
-    surface.blits(blits)
+def _layout_text(text: Text) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+    y: int = 0
+    line_height: int = _line_height(text.font)
+
+    layout: list[tuple[pygame.Surface, tuple[int, int]]] = []
+    for start, end in _wrap_lines(text.text, text.font, text.rect.width):
+        img: pygame.Surface = text.font.render(text.text[start:end], False, text.color[:3]).convert()
+        layout.append((img, (0, y)))
+        y += line_height
+
+    return layout
+
+
+def _render_text(text: Text, surface: pygame.Surface, origin: tuple[int, int] = (0, 0)) -> None:
+    Profiler.start("render_text")
+    # cached lines are shared between every alpha the text is drawn at, so alpha is applied per draw
+    alpha: int | None = text.color[3] if text.color[3] < 255 else None
+    left: int = text.rect.left - origin[0]
+    top: int = text.rect.top - origin[1]
+
+    blits: list = []
+    for img, (x, y) in TextCache.get(text):
+        img.set_alpha(alpha)
+        blits.append((img, (left + x, top + y)))
+
+    surface.blits(blits, doreturn=False)
+    Profiler.stop("render_text")
+
+
+def _select_indicator(button: Button) -> Text:
+    return Text(
+        "*", button.select_color,
+        button.text.rect.midleft + button.select_pos,
+        button.select_font, align_center=True
+    )
+
+
+class Widget:
+    def __init__(self, rect: pygame.Rect):
+        self.rect: pygame.Rect = rect
+        self.dirty: bool = True
+        self.surface: pygame.Surface | None = None
+
+    def set_choice(self, choice: int) -> None:
+        pass
+
+    def bake(self, background: tuple[int, int, int]) -> None:
+        if self.surface is None:
+            self.surface = pygame.Surface((max(self.rect.w, 1), max(self.rect.h, 1))).convert()
+        self.surface.fill(background)
+        self.draw(self.surface)
+        self.dirty = False
+
+    def draw(self, surface: pygame.Surface) -> None:
+        pass
+
+
+class TextWidget(Widget):
+    def __init__(self, text: Text):
+        super().__init__(pygame.Rect(text.rect))
+        self.text: Text = text
+
+    def draw(self, surface: pygame.Surface) -> None:
+        _render_text(self.text, surface, self.rect.topleft)
+
+
+class ButtonWidget(Widget):
+    def __init__(self, button: Button, button_index: int):
+        self.button: Button = button
+        self.button_index: int = button_index
+        self.indicator: Text = _select_indicator(button)
+        self.selected: bool = False
+        super().__init__(button.text.rect.union(self.indicator.rect))
+
+    def set_choice(self, choice: int) -> None:
+        if (choice == self.button_index) != self.selected:
+            self.selected = not self.selected
+            self.dirty = True
+
+    def draw(self, surface: pygame.Surface) -> None:
+        _render_text(self.button.text, surface, self.rect.topleft)
+        if self.selected:
+            _render_text(self.indicator, surface, self.rect.topleft)
+
+
+class WidgetTree:
+    def __init__(self, background: tuple[int, int, int] = (0, 0, 0)):
+        self.background: tuple[int, int, int] = background
+        self.widgets: list[Widget] = []
+
+    def add(self, widget: Widget) -> Widget:
+        self.widgets.append(widget)
+        return widget
+
+    def draw(self, surface: pygame.Surface, choice: int, force: bool) -> bool:
+        for widget in self.widgets:
+            widget.set_choice(choice)
+
+        # each widget keeps its own baked surface, only the ones whose state changed are re-baked and blitted
+        if force:
+            surface.fill(self.background)
+
+        drawn: bool = force
+        for widget in self.widgets:
+            if widget.dirty:
+                widget.bake(self.background)
+            elif not force:
+                continue
+            surface.blit(widget.surface, widget.rect)
+            drawn = True
+        return drawn
 
 
 class UIManager:
     def __init__(self, window_surface: pygame.Surface):
         self.window_surface: pygame.Surface = window_surface
+        TextCache.BUDGET = Config.TEXT_CACHE_BUDGET
+        self.dialogue_box: DialogueBox = DialogueBox()
 
         self.num_buttons: int = 0
         self.choice: int = 0
@@ -77,12 +238,11 @@ class UIManager:
     def draw_button(self, button: Button, button_index: int, surface: pygame.Surface = None) -> None:
         _render_text(button.text, surface if surface is not None else self.window_surface)
         if self.choice == button_index:
-            _render_text(Text(
-                "*", button.select_color,
-                button.text.rect.midleft + button.select_pos,
-                button.select_font, align_center=True
-            ), surface if surface is not None else self.window_surface)
-    
+            _render_text(_select_indicator(button), surface if surface is not None else self.window_surface)
+
+    def draw_widgets(self, tree: WidgetTree, surface: pygame.Surface = None, force: bool = False) -> bool:
+        return tree.draw(surface if surface is not None else self.window_surface, self.choice, force)
+
     def input(self, keys: pygame.key.ScancodeWrapper) -> None:
         moving: bool = False
 
@@ -0,0 +1,98 @@
+from src.dispatch_scheduler import DispatchScheduler
+from src.event import DispatchChain, DispatchEvent
+
+STEP = 1 / 120
+
+
+class Pending(DispatchEvent):
+    def __init__(self):
+        super().__init__()
+        self.done: bool = False
+
+    def is_complete(self, scene) -> bool:
+        return self.done
+
+    def complete(self) -> None:
+        self.done = True
+        self.finish()
+
+
+class Instant(DispatchEvent):
+    def is_complete(self, scene) -> bool:
+        return self.dispatched
+
+
+class CountingChain(DispatchChain):
+    def __init__(self, dispatch: list[DispatchEvent]):
+        super().__init__(dispatch)
+        self.polls: int = 0
+
+    def update(self, scene, dt: float) -> int | None:
+        self.polls += 1
+        return super().update(scene, dt)
+
+
+class StubScene:
+    def __init__(self):
+        self.dispatch_scheduler: DispatchScheduler = DispatchScheduler()
+
+    def add_dispatch_chain(self, chain: DispatchChain) -> None:
+        self.dispatch_scheduler.add(chain)
+        chain.start(self)
+
+    def remove_dispatch_chain(self, chain: DispatchChain) -> None:
+        self.dispatch_scheduler.remove(chain)
+
+    def step(self, steps: int) -> None:
+        for _ in range(steps):
+            self.dispatch_scheduler.update(self, STEP)
+
+
+def _blocked_chain() -> tuple[StubScene, CountingChain, Pending, Instant]:
+    pending: Pending = Pending()
+    after: Instant = Instant()
+    after.wait_for_previous = True
+
+    scene: StubScene = StubScene()
+    chain: CountingChain = CountingChain([pending, after])
+    scene.add_dispatch_chain(chain)
+    scene.step(2)
+    return scene, chain, pending, after
+
+
+def test_blocked_chain_is_not_polled():
+    scene, chain, pending, after = _blocked_chain()
+    polls: int = chain.polls
+
+    scene.step(100)
+
+    assert chain.parked
+    assert chain.polls == polls
+    assert not after.dispatched
+    assert scene.dispatch_scheduler.runnable == []
+
+
+def test_finished_dispatch_wakes_blocked_chain():
+    scene, chain, pending, after = _blocked_chain()
+
+    pending.complete()
+    scene.step(1)
+
+    assert not chain.parked
+    assert after.dispatched
+
+
+def test_chain_waiting_on_its_last_dispatch_is_not_polled():
+    pending: Pending = Pending()
+    scene: StubScene = StubScene()
+    chain: CountingChain = CountingChain([Instant(), pending])
+    scene.add_dispatch_chain(chain)
+    scene.step(3)
+    polls: int = chain.polls
+
+    scene.step(100)
+    assert chain.polls == polls
+
+    pending.complete()
+    scene.step(1)
+    assert not chain.scheduled